@@ -67,3 +67,14 @@ class LLMAdapter(ABC):
             LLMTimeoutError: Request timed out
         """
         ...
+
+    def preload(self, model: str, num_ctx: int = 8192) -> None:
+        """Load a model ahead of its first request (best effort).
+
+        Adapters without a separate load step leave this as a no-op.
+        Implementations must not raise.
+
+        Args:
+            model: Model name (e.g., "llama3.1:8b")
+            num_ctx: Context window size the model will be used with
+        """
@@ -2,6 +2,7 @@
 
 import json
 import logging
+from functools import lru_cache
 from typing import Iterator
 
 import requests
@@ -16,9 +17,12 @@ from src.core.exceptions import (
 logger = logging.getLogger("reddiscribe")
 
 
+@lru_cache(maxsize=256)
 def format_model_size(size_bytes: int) -> str:
     """Format model size in bytes to human-readable string.
 
+    Memoized: the same few sizes come back on every model list refresh.
+
     Args:
         size_bytes: Model size in bytes
 
@@ -343,6 +347,25 @@ class OllamaAdapter(LLMAdapter):
             logger.error(f"Failed to parse non-streaming chat response: {e}")
             raise OllamaNotRunningError(f"Invalid response from Ollama: {e}")
 
+    def preload(self, model: str, num_ctx: int = 8192) -> None:
+        """Ask Ollama to load a model into memory without generating.
+
+        A request with no prompt only loads the model. num_ctx must match
+        later requests, otherwise Ollama reloads the model for them.
+        """
+        if not model:
+            return
+        self._used_models.add(model)
+        try:
+            requests.post(
+                self._generate_url,
+                json={"model": model, "stream": False, "options": {"num_ctx": num_ctx}},
+                timeout=self._timeout,
+            )
+            logger.debug(f"Preloaded model: {model}")
+        except Exception as e:
+            logger.debug(f"Failed to preload {model}: {e}")
+
     def unload_models(self):
         """Unload all models used during this session from VRAM."""
         for model in self._used_models:
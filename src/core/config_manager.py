@@ -3,7 +3,7 @@
 import logging
 import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Set
 
 import yaml
 
@@ -12,6 +12,9 @@ from src.core.exceptions import ConfigError
 logger = logging.getLogger(__name__)
 
 
+# get() default that no stored value can equal
+_MISSING = object()
+
 # Default configuration template
 DEFAULT_CONFIG = {
     "app": {
@@ -89,6 +92,8 @@ class ConfigManager:
 
     _instance = None
     _lock = threading.RLock()
+    # Change listeners; replaced (never mutated) so set() can iterate without a lock
+    _listeners: tuple[Callable[[str, Any], None], ...] = ()
 
     def __new__(cls):
         """Ensure singleton instance."""
@@ -161,16 +166,32 @@ class ConfigManager:
             ''
         """
         with self._instance_lock:
-            parts = key.split('.')
-            value = self._config
+            return self._lookup(key, default)
 
-            for part in parts:
-                if isinstance(value, dict) and part in value:
-                    value = value[part]
-                else:
-                    return default
+    def get_many(self, pairs: list[tuple[str, Any]]) -> list[Any]:
+        """Get several configuration values under a single lock acquisition.
 
-            return value
+        Args:
+            pairs: (dot-notation key, default) tuples
+
+        Returns:
+            Values in the same order as *pairs*, defaults where missing.
+
+        Example:
+            >>> locale, theme = config.get_many([("app.locale", "ko_KR"), ("app.theme", "dark")])
+        """
+        with self._instance_lock:
+            return [self._lookup(key, default) for key, default in pairs]
+
+    def _lookup(self, key: str, default=None) -> Any:
+        """Walk the config dict for *key*; caller must hold _instance_lock."""
+        value = self._config
+        for part in key.split('.'):
+            if isinstance(value, dict) and part in value:
+                value = value[part]
+            else:
+                return default
+        return value
 
     def get_missing_models(self, roles: list[str]) -> list[str]:
         """Check which model roles have empty/missing names.
@@ -214,14 +235,43 @@ class ConfigManager:
             # Set final value
             target[parts[-1]] = value
 
-    def update(self, changes: dict) -> None:
+        for listener in self._listeners:
+            try:
+                listener(key, value)
+            except Exception as e:
+                logger.error(f"Config listener failed for '{key}': {e}")
+
+    def add_listener(self, callback: Callable[[str, Any], None]) -> None:
+        """Register a callback invoked as callback(key, value) after each set().
+
+        Lets callers cache values such as "app.locale" instead of calling
+        get() on every use. update() goes through set(), so it notifies too.
+
+        Args:
+            callback: Called with the dot-notation key and its new value.
+        """
+        with self._instance_lock:
+            self._listeners = (*self._listeners, callback)
+
+    def remove_listener(self, callback: Callable[[str, Any], None]) -> None:
+        """Unregister a callback added with add_listener()."""
+        with self._instance_lock:
+            self._listeners = tuple(cb for cb in self._listeners if cb != callback)
+
+    def update(self, changes: dict) -> Set[str]:
         """Batch update configuration from flat dict of dot-notation keys.
 
         Applies validation rules and saves to disk once after all updates.
+        Keys whose validated value equals the current one are not set again,
+        so listeners only hear about real changes; if no key changed, the
+        file is not rewritten either.
 
         Args:
             changes: Dict with dot-notation keys as keys
 
+        Returns:
+            The keys whose stored value actually changed.
+
         Example:
             >>> config.update({
             ...     "app.locale": "en_US",
@@ -239,7 +289,7 @@ class ConfigManager:
 
             for key, value in changes.items():
                 validated_value = self._validate_key_value(key, value)
-                if validated_value is not None:
+                if validated_value is not None and self.get(key, _MISSING) != validated_value:
                     validated_changes[key] = validated_value
 
             # Apply all validated changes
@@ -247,7 +297,9 @@ class ConfigManager:
                 self.set(key, value)
 
             # Save to disk once
-            self.save()
+            if validated_changes:
+                self.save()
+            return set(validated_changes)
 
     def _validate_key_value(self, key: str, value: Any) -> Any:
         """Apply validation rules to key-value pair.
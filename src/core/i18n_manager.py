@@ -4,7 +4,7 @@ import json
 import logging
 import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
 # Path resolution
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -38,6 +38,8 @@ class I18nManager:
             return
         self._data: Dict[str, Any] = {}
         self._locale: str = "ko_KR"  # default
+        self._cache: Dict[str, str] = {}  # key -> resolved string for get_cached()
+        self._revision: int = 0  # bumped on every successful load_locale()
         self._initialized = True
 
     def load_locale(self, locale: str) -> None:
@@ -59,6 +61,8 @@ class I18nManager:
                 with open(locale_file, "r", encoding="utf-8") as f:
                     self._data = json.load(f)
                     self._locale = locale
+                    self._cache = {}
+                    self._revision += 1
                 logger.info(f"Loaded locale: {locale}")
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse locale file {locale_file}: {e}")
@@ -75,23 +79,63 @@ class I18nManager:
         Returns:
             Translated string with placeholders substituted, or the key itself if not found.
 
-        Thread-safe. Never raises exceptions.
+        Thread-safe. Never raises exceptions. The template is memoized per
+        locale (shared with get_cached()); only the formatting runs per call.
 
         Examples:
             get("reader.summary") -> "AI 요약"
             get("errors.model_not_found", model="llama3") -> "모델을 찾을 수 없습니다: llama3"
         """
-        with self._lock:
-            template = self._resolve(key)
+        template = self.get_cached(key)
 
-            if not kwargs:
-                return template
+        if not kwargs:
+            return template
 
-            try:
-                return template.format_map(kwargs)
-            except (KeyError, ValueError) as e:
-                logger.warning(f"Failed to format i18n string for key '{key}': {e}")
-                return template
+        try:
+            return template.format_map(kwargs)
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Failed to format i18n string for key '{key}': {e}")
+            return template
+
+    def get_cached(self, key: str) -> str:
+        """Get the raw (unformatted) string for *key*, memoized per locale.
+
+        Backs get() and snapshot(); use it directly on hot paths that need
+        no placeholders. The cache is dropped whenever a locale loads.
+
+        Args:
+            key: Dot-separated key path (e.g., "reader.summary")
+
+        Returns:
+            Same as get(key).
+        """
+        cached = self._cache.get(key)
+        if cached is None:
+            with self._lock:
+                cached = self._cache[key] = self._resolve(key)
+        return cached
+
+    def snapshot(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Resolve several placeholder-free keys under a single lock.
+
+        Meant for retranslate_ui(), which reads a fixed set of keys at once;
+        results share the get_cached() memo.
+
+        Args:
+            keys: Dot-separated key paths
+
+        Returns:
+            Dict mapping each key to get_cached(key).
+        """
+        with self._lock:
+            cache = self._cache
+            result = {}
+            for key in keys:
+                value = cache.get(key)
+                if value is None:
+                    value = cache[key] = self._resolve(key)
+                result[key] = value
+            return result
 
     @property
     def locale(self) -> str:
@@ -103,6 +147,15 @@ class I18nManager:
         with self._lock:
             return self._locale
 
+    @property
+    def revision(self) -> int:
+        """Monotonic counter of successful load_locale() calls.
+
+        Widgets compare it with the value seen on their last retranslate_ui()
+        to skip redundant relabeling.
+        """
+        return self._revision
+
     @classmethod
     def reset(cls) -> None:
         """Reset singleton instance (for testing)."""
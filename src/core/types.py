@@ -19,6 +19,11 @@ class PostDTO:
     permalink: str = ""
     created_utc: float = 0.0
     is_self: bool = True
+    # Post list row suffix "  [↑score]  [💬comments]", built once per DTO
+    display_suffix: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.display_suffix = f"  [\u2191{self.score}]  [\U0001f4ac{self.num_comments}]"
 
 
 @dataclass
@@ -60,4 +65,4 @@ class WriterContext:
     comment_id: str = ""
     comment_body: str = ""
     comment_author: str = ""
-    parent_thread: list = field(default_factory=list)  # list[dict] for reply thread
+    parent_thread: list[CommentDTO] = field(default_factory=list)  # reply thread, outermost first
@@ -13,6 +13,7 @@ from src.gui.widgets.reader_widget import ReaderWidget
 from src.gui.widgets.writer_widget import WriterWidget
 from src.gui.widgets.settings_widget import SettingsWidget
 from src.gui.widgets.top_bar_widget import TopBarWidget
+from src.gui.widgets.subreddit_list_model import SubredditListModel
 from src.gui.task_coordinator import TaskCoordinator
 from src.services.reader_service import ReaderService
 from src.services.writer_service import WriterService
@@ -52,8 +53,13 @@ class MainWindow(QMainWindow):
         outer_layout.setContentsMargins(0, 0, 0, 0)
         outer_layout.setSpacing(0)
 
+        # One subreddit list for the top bar combo and the settings tab
+        self._subreddit_model = SubredditListModel.from_config(self._config, self)
+
         # === Global Top Bar ===
-        self._top_bar = TopBarWidget(self._config, self._reddit_adapter)
+        self._top_bar = TopBarWidget(
+            self._config, self._reddit_adapter, subreddit_model=self._subreddit_model,
+        )
         self._top_bar.subreddit_changed.connect(self._on_subreddit_changed)
 
         main_layout = QHBoxLayout()
@@ -95,7 +101,10 @@ class MainWindow(QMainWindow):
 
         self._reader_widget = ReaderWidget(self._reader_service, self._config, self._coordinator)
         self._writer_widget = WriterWidget(self._writer_service, self._config, self._coordinator)
-        self._settings_widget = SettingsWidget(self._config, self._ollama_adapter, self._reddit_adapter)
+        self._settings_widget = SettingsWidget(
+            self._config, self._ollama_adapter, self._reddit_adapter,
+            subreddit_model=self._subreddit_model,
+        )
 
         # Connect settings signals
         self._settings_widget.locale_changed.connect(self._on_locale_changed)
@@ -139,9 +148,8 @@ class MainWindow(QMainWindow):
         self.retranslate_ui()
         self._status_bar.showMessage(self._i18n.get("status.language_changed"), 3000)
 
-    def _on_settings_saved(self):
+    def _on_settings_saved(self, _changed: set):
         self._status_bar.showMessage(self._i18n.get("status.settings_saved"), 3000)
-        self._top_bar.reload_subreddits()
 
     def _on_write_requested(self, context):
         """Handle write request from Reader (comment/reply button clicked)."""
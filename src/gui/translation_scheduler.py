@@ -0,0 +1,195 @@
+"""Priority scheduler for reader translation workers."""
+
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass, field, replace
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QObject
+
+from src.gui.task_coordinator import TaskCoordinator
+from src.gui.workers import GenerationWorker
+
+logger = logging.getLogger("reddiscribe")
+
+# Lower value runs first
+PRIORITY_POST_BODY = 0
+PRIORITY_COMMENTS = 10
+PRIORITY_TITLES = 20
+PRIORITY_PREFETCH = 30
+
+
+@dataclass(order=True)
+class _Job:
+    priority: int
+    seq: int
+    task_id: str = field(compare=False)
+    setup: Callable[[GenerationWorker], bool] = field(compare=False)
+    cancel_group: str = field(compare=False)
+    on_cancel: Optional[Callable[[], None]] = field(compare=False, default=None)
+    worker: Optional[GenerationWorker] = field(compare=False, default=None)
+    dropped: bool = field(compare=False, default=False)
+    delivered: bool = field(compare=False, default=False)  # finished/error emitted
+
+
+class TranslationScheduler(QObject):
+    """Runs reader LLM jobs one at a time, highest priority first.
+
+    Jobs are submitted as setup callbacks that configure and connect a fresh
+    GenerationWorker; the scheduler starts it when the job's turn comes. It registers each job with the
+    TaskCoordinator as a normal task, so writer exclusive mode still holds
+    reader work back, and reports finish_normal when the worker ends.
+
+    Nothing here blocks on QThread.wait(): a preempted or cancelled worker is
+    only asked to stop, its signals are disconnected, and it is kept alive
+    until its thread actually exits.
+
+    Usage:
+        scheduler = TranslationScheduler(coordinator, parent=self)
+        scheduler.submit(PRIORITY_POST_BODY, "reader_translation", setup_worker,
+                         cancel_group="reader", on_cancel=reset_ui)
+        scheduler.cancel_group("reader")
+    """
+
+    def __init__(self, coordinator: TaskCoordinator, parent=None):
+        super().__init__(parent)
+        self._coordinator = coordinator
+        self._pending: list[_Job] = []  # heap ordered by (priority, seq)
+        self._current: Optional[_Job] = None
+        self._retired: set[GenerationWorker] = set()  # stopped, thread still exiting
+        self._seq = itertools.count()
+
+    def submit(self, priority: int, task_id: str,
+               setup: Callable[[GenerationWorker], bool], *,
+               cancel_group: str, on_cancel: Optional[Callable[[], None]] = None):
+        """Queue a job, replacing any queued or running job with the same task_id.
+
+        A running job with lower priority is stopped and re-queued so the new
+        job starts right away; lower-priority work is postponed, not lost.
+
+        Args:
+            priority: One of the PRIORITY_* constants (lower runs first).
+            task_id: Coordinator task id; also identifies superseded jobs.
+            setup: Configures and connects the given GenerationWorker (without
+                starting it). Returns False if there turns out to be nothing
+                to do.
+            cancel_group: Group name used by cancel_group().
+            on_cancel: Called if the job is stopped after it has started but
+                before it delivered a result, so the caller can undo UI
+                state (no finished/error signal will arrive).
+        """
+        self._drop_pending(lambda job: job.task_id == task_id)
+        current = self._current
+        if current is not None:
+            if current.task_id == task_id:
+                self._stop_current()
+            elif (priority < current.priority and current.worker is not None
+                  and not current.delivered):
+                logger.debug(f"Preempting '{current.task_id}' for '{task_id}'")
+                self._stop_current()
+                # Re-queue a fresh copy; it restarts from scratch later
+                heapq.heappush(self._pending, replace(current, worker=None, dropped=False,
+                                                      delivered=False))
+
+        heapq.heappush(self._pending, _Job(
+            priority, next(self._seq), task_id, setup, cancel_group, on_cancel,
+        ))
+        self._pump()
+
+    def cancel(self, task_id: str):
+        """Drop the queued job and stop the running job with *task_id* (non-blocking)."""
+        self._drop_pending(lambda job: job.task_id == task_id)
+        if self._current is not None and self._current.task_id == task_id:
+            self._stop_current()
+            self._pump()
+
+    def cancel_group(self, group: str):
+        """Drop queued jobs and stop the running job of *group* (non-blocking)."""
+        self._drop_pending(lambda job: job.cancel_group == group)
+        if self._current is not None and self._current.cancel_group == group:
+            self._stop_current()
+            self._pump()
+
+    def has_job(self, task_id: str) -> bool:
+        """True if a job with *task_id* is queued or running."""
+        current = self._current
+        if current is not None and current.task_id == task_id and not current.delivered:
+            return True
+        return any(job.task_id == task_id for job in self._pending)
+
+    def pending_count(self, group: str) -> int:
+        """Number of queued or running jobs in *group*."""
+        count = sum(1 for job in self._pending if job.cancel_group == group)
+        if self._current is not None and self._current.cancel_group == group:
+            count += 1
+        return count
+
+    # ------------------------------------------------------------------
+
+    def _drop_pending(self, predicate: Callable[[_Job], bool]):
+        kept = [job for job in self._pending if not predicate(job)]
+        if len(kept) != len(self._pending):
+            self._pending = kept
+            heapq.heapify(self._pending)
+
+    def _pump(self):
+        """Start the next pending job if nothing is running."""
+        if self._current is not None or not self._pending:
+            return
+        job = heapq.heappop(self._pending)
+        self._current = job
+        if self._coordinator.request_normal(job.task_id, lambda: self._launch(job)):
+            self._launch(job)
+        # else: coordinator calls _launch once the exclusive task finishes
+
+    def _launch(self, job: _Job):
+        if job.dropped or job is not self._current:
+            # Cancelled while waiting on the coordinator; release its slot
+            # unless a replacement with the same task id now owns it
+            if self._current is None or self._current.task_id != job.task_id:
+                self._coordinator.finish_normal(job.task_id)
+            return
+        if job.worker is not None:
+            return  # already launched
+        worker = GenerationWorker()
+        # Connected before setup() so it runs ahead of the caller's slots
+        worker.finished_signal.connect(lambda _text, j=job: setattr(j, "delivered", True))
+        worker.error_occurred.connect(lambda _key, j=job: setattr(j, "delivered", True))
+        if not job.setup(worker):
+            self._finish(job)
+            return
+        job.worker = worker
+        worker.finished.connect(lambda j=job: self._finish(j))
+        worker.start()
+
+    def _finish(self, job: _Job):
+        """Worker thread exited (or job had nothing to run)."""
+        if job is not self._current:
+            return
+        self._current = None
+        self._coordinator.finish_normal(job.task_id)
+        self._pump()
+
+    def _stop_current(self):
+        """Stop the running job without waiting for its thread."""
+        job = self._current
+        self._current = None
+        job.dropped = True
+        worker = job.worker
+        if worker is None:
+            # Still queued in the coordinator; _launch will release it
+            return
+        self._coordinator.finish_normal(job.task_id)
+        worker.stop()
+        for signal in (worker.tokens_ready, worker.parsed_signal,
+                       worker.finished_signal, worker.error_occurred):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass  # nothing connected
+        if worker.isRunning():
+            self._retired.add(worker)
+            worker.finished.connect(lambda w=worker: self._retired.discard(w))
+        if job.on_cancel is not None and not job.delivered:
+            job.on_cancel()
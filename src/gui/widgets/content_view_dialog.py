@@ -46,11 +46,8 @@ class ContentViewDialog(QDialog):
             layout.addWidget(thread_label)
 
             for item in self._context.parent_thread:
-                author = item.get("author", "[deleted]")
-                body = item.get("body", "")
-                depth = item.get("depth", 0)
-                indent = "  " * depth
-                thread_text = QLabel(f"{indent}@{author}: {body}")
+                indent = "  " * item.depth
+                thread_text = QLabel(f"{indent}@{item.author}: {item.body}")
                 thread_text.setWordWrap(True)
                 thread_text.setStyleSheet(
                     "color: #cccccc; padding: 4px 8px; "
@@ -0,0 +1,52 @@
+"""List model backing the reader's post list."""
+
+from typing import Optional
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from src.core.types import PostDTO
+
+
+class PostListModel(QAbstractListModel):
+    """Post rows for a QListView, built on demand in data().
+
+    Only rows the view actually asks for (the visible ones) are built from
+    the title and the DTO's precomputed display_suffix; the row text is
+    cached so translated titles can be prepended without rebuilding it.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._posts: list[PostDTO] = []
+        self._rows: list[Optional[str]] = []  # formatted row text, filled lazily
+        self._translations: list[Optional[str]] = []  # translated title per row
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._posts)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        text = self._rows[row]
+        if text is None:
+            post = self._posts[row]
+            text = self._rows[row] = post.title + post.display_suffix
+        translated = self._translations[row]
+        return f"{translated}\n{text}" if translated else text
+
+    def set_posts(self, posts: list[PostDTO]):
+        """Replace all rows (drops existing title translations)."""
+        self.beginResetModel()
+        self._posts = posts
+        self._rows = [None] * len(posts)
+        self._translations = [None] * len(posts)
+        self.endResetModel()
+
+    def set_translation(self, row: int, text: str):
+        """Show *text* above the original title of *row*."""
+        if not 0 <= row < len(self._posts):
+            return
+        self._translations[row] = text
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
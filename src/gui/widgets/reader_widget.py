@@ -1,27 +1,150 @@
 """Reader widget for browsing Reddit posts with AI translation."""
 
 import logging
-from typing import Optional
+import re
+import weakref
+from collections import OrderedDict, deque
+from functools import partial
+from itertools import islice
+from typing import Iterable, Iterator, Optional
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QListWidget, QListWidgetItem, QPushButton, QLabel,
+    QListView, QPushButton, QLabel,
     QTextEdit, QComboBox, QScrollArea,
     QFrame, QMessageBox,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker, QThreadPool
+from PyQt6 import sip
 
 from src.core.i18n_manager import I18nManager
 from src.core.types import PostDTO, CommentDTO, WriterContext
-from src.gui.workers import RedditFetchWorker, GenerationWorker
+from src.gui.workers import RedditFetchWorker, GenerationWorker, GenerationTask
+from src.gui.widgets.post_list_model import PostListModel
 from src.gui.task_coordinator import TaskCoordinator
+from src.gui.translation_scheduler import (
+    TranslationScheduler, PRIORITY_POST_BODY, PRIORITY_COMMENTS, PRIORITY_TITLES,
+    PRIORITY_PREFETCH,
+)
 from src.services.reader_service import ReaderService
 
 logger = logging.getLogger("reddiscribe")
 
 # Client-side rendering depth limit (spec 7.2)
 MAX_COMMENT_DEPTH = 5
-COMMENTS_RENDER_BATCH = 5
+COMMENTS_RENDER_BATCH = 30  # comment rows (frames) rendered per scroll step
+COMMENTS_RENDER_CHUNK = 10  # rows built per event-loop turn within a batch
+# Coalesce rapid subreddit/sort changes into a single fetch
+FETCH_DEBOUNCE_MS = 150
+# Streamed translation tokens are appended to the text edit at most this often
+TOKEN_FLUSH_MS = 50
+# Scroll events are coalesced into at most one more-comments check per interval
+MORE_CHECK_MS = 50
+# Next comment batch renders once scrolled past MORE_AT_NUM / MORE_AT_DEN
+MORE_AT_NUM, MORE_AT_DEN = 4, 5
+# Neighbor rows whose body translation is prefetched on selection (nearest first)
+PREFETCH_OFFSETS = (1, -1, 2, -2)
+PREFETCH_MAX_JOBS = 2
+# On-demand single comment translations run concurrently on a small pool
+SINGLE_TRANSLATE_THREADS = 2
+# Post body translations kept in memory in front of the DB cache (LRU)
+TRANSLATION_CACHE_SIZE = 256
+
+# Numbered LLM output: "N. title" (one line each) and "[N] comment" blocks that
+# run until the next "[N]" line, continuation lines included
+_TITLE_RE = re.compile(r'^[ \t]*(\d+)\.[ \t]*(.*\S)', re.M)
+_COMMENT_RE = re.compile(r'^[ \t]*\[(\d+)\][ \t]*(.*?)(?=^[ \t]*\[\d+\]|\Z)', re.M | re.S)
+_LINE_BREAK_RE = re.compile(r'\s*\n\s*')
+
+# Comment and loading-indicator styles, set once on the reader and matched by
+# object name so Qt parses them a single time instead of per created widget
+_READER_QSS = """
+QLabel#loadingDots { color: #888; }
+QPushButton#replyBtn, QPushButton#translateBtn { font-size: 11px; padding: 2px 8px; }
+QLabel#moreIndicator { color: #888; font-size: 18px; padding: 8px; }
+QLabel#moreLabel { color: gray; font-style: italic; }
+QFrame#transSep { color: #555; }
+QLabel#transHeader { color: #4fc3f7; font-size: 11px; font-weight: bold; }
+QLabel#transLabel { color: #ccc; }
+"""
+
+# Static head of the batch comment-translation prompt; numbered bodies follow
+_COMMENT_PROMPT_PREFIX = (
+    "Translate each numbered Reddit comment below to Korean.\n"
+    "\n"
+    "Rules:\n"
+    "- Keep the same numbering [1] [2] [3]...\n"
+    "- Preserve tone and style\n"
+    "- Output ONLY the numbered translations\n"
+    "\n"
+)
+
+
+def _comment_prompt_max_chars(num_ctx: int) -> int:
+    """Comment body characters per translation request that fit *num_ctx*.
+
+    Estimates ~3 characters per token and reserves as much again for the
+    translated output, plus a margin for the prompt prefix.
+    """
+    return max(0, (num_ctx - 512) * 3 // 2 - 500)
+
+
+def _walk(roots: Iterable[CommentDTO]) -> Iterator[tuple[CommentDTO, int]]:
+    """Yield (comment, depth) depth-first in render order, capped at MAX_COMMENT_DEPTH.
+
+    Uses an explicit stack instead of recursion so deep threads cost no
+    Python frames per node.
+    """
+    stack = deque((c, 0) for c in reversed(list(roots)))
+    while stack:
+        comment, depth = stack.pop()
+        yield comment, depth
+        if depth < MAX_COMMENT_DEPTH:
+            stack.extend((child, depth + 1) for child in reversed(comment.children))
+
+
+def _row_key(row: tuple[CommentDTO, int]) -> tuple[str, str, int]:
+    """Identity of a flattened comment row for reuse checks."""
+    comment, depth = row
+    return comment.id, comment.body, depth
+
+
+class _NumberedStreamParser:
+    """Incrementally parse "[N] text" LLM output as tokens stream in.
+
+    Unnumbered lines continue the previous entry; an entry is complete once
+    the next "[N]" line starts (or the stream closes). Meant to be handed to
+    GenerationWorker.configure_post_process so parsing runs off the UI thread.
+    """
+
+    def __init__(self):
+        self._buf = ""  # text from the start of the current (incomplete) entry
+
+    def feed(self, chunk: str) -> dict[int, str]:
+        """Consume a streamed chunk; return entries completed by it."""
+        self._buf += chunk
+        if "\n" not in chunk:
+            return {}
+        matches = list(_COMMENT_RE.finditer(self._buf))
+        if len(matches) < 2:
+            return {}
+        self._buf = self._buf[matches[-1].start():]
+        return self._entries(matches[:-1])
+
+    def close(self) -> dict[int, str]:
+        """Return the remaining entries once the stream has ended."""
+        done = self._entries(_COMMENT_RE.finditer(self._buf))
+        self._buf = ""
+        return done
+
+    @staticmethod
+    def _entries(matches) -> dict[int, str]:
+        done = {}
+        for m in matches:
+            text = _LINE_BREAK_RE.sub(" ", m.group(2).strip())
+            if text:
+                done[int(m.group(1))] = text
+        return done
 
 
 class ReaderWidget(QWidget):
@@ -37,6 +160,17 @@ class ReaderWidget(QWidget):
     navigate_to_settings = pyqtSignal()
     write_requested = pyqtSignal(object)  # WriterContext
 
+    # Keys read by retranslate_ui(), resolved in one I18nManager.snapshot()
+    _I18N_KEYS = (
+        "reader.posts",
+        "reader.translation",
+        "reader.comments",
+        "reader.refresh",
+        "reader.toggle_translation",
+        "reader.toggle_original",
+        "reader.write_comment",
+    )
+
     def __init__(self, reader_service: ReaderService, config, coordinator: TaskCoordinator, parent=None):
         """Initialize the reader widget.
 
@@ -48,24 +182,38 @@ class ReaderWidget(QWidget):
         super().__init__(parent)
         self._reader = reader_service
         self._config = config
+        # Hot settings cached here; refreshed by _on_config_changed
+        self._locale: str = config.get("app.locale", "ko_KR")
+        self._logic_model_name: str = config.get("llm.models.logic.name", "")
+        self._logic_num_ctx: int = config.get("llm.models.logic.num_ctx", 8192)
+        config.add_listener(self._on_config_changed)
         self._i18n = I18nManager()
+        self._last_locale_rev = -1  # I18nManager.revision at last retranslate_ui()
         self._current_posts: list[PostDTO] = []
         self._current_post: Optional[PostDTO] = None
         self._current_subreddit: str = ""
 
-        # Workers (kept as instance attrs to prevent GC and allow stop)
-        self._fetch_worker: Optional[RedditFetchWorker] = None
-        self._comment_worker: Optional[RedditFetchWorker] = None
-        self._gen_worker: Optional[GenerationWorker] = None
-        self._title_worker: Optional[GenerationWorker] = None
-        self._comment_translate_worker: Optional[GenerationWorker] = None
-        self._translated_titles: dict[int, str] = {}  # row index -> translated title
-        self._comments_list: list[CommentDTO] = []  # stored for lazy rendering
-        self._translated_comment_count: int = 0  # how many comments translated so far
-        self._rendered_comment_count: int = 0  # how many top-level comments rendered
+        # Reddit fetch workers still running (kept to prevent GC and allow stop)
+        self._active_workers: set[RedditFetchWorker] = set()
+        self._worker_generation: int = 0  # bumped per fetch; older results are dropped
+        self._flat_comments: list[tuple[CommentDTO, int]] = []  # (comment, depth) in render order
+        self._translated_comment_count: int = 0  # rows scanned by batch translation so far
+        self._rendered_comment_count: int = 0  # how many rows of _flat_comments rendered
+        # Per-row state, parallel to _flat_comments
+        self._comment_translations: list[Optional[str]] = []
+        self._comment_frames: list[Optional[QFrame]] = []  # None until rendered
+        self._comment_index: dict[str, int] = {}  # comment_id -> row in _flat_comments
         self._showing_original: bool = False  # toggle state for original/translation
+        # (post_id, locale) -> body translation, most recently used last
+        self._trans_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
         self._coordinator = coordinator
-        self._comment_widgets: dict[str, QFrame] = {}  # comment_id -> frame widget
+        # Single-comment translations: pooled tasks, kept referenced until done
+        self._translate_pool = QThreadPool(self)
+        self._translate_pool.setMaxThreadCount(SINGLE_TRANSLATE_THREADS)
+        self._single_tasks: set[GenerationTask] = set()
+        # Post body / comment / title translations, one LLM job at a time
+        self._scheduler = TranslationScheduler(coordinator, parent=self)
+        self._comments_post_id: str = ""  # post whose comments are currently rendered
         self._more_indicator = None
 
         self._init_ui()
@@ -76,6 +224,36 @@ class ReaderWidget(QWidget):
         self._anim_timer.timeout.connect(self._animate_loading)
         self._anim_dot_count = 0
         self._anim_target: Optional[QTextEdit] = None
+        self._anim_active: bool = False  # cleared by the first streamed token
+        self._anim_frames: tuple[str, ...] = ()  # indicator text per dot count (0-3)
+        self._anim_label: Optional[QLabel] = None  # overlay on the target's viewport
+
+        # Streamed tokens are buffered and inserted in one edit per flush
+        self._token_buffer: list[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(TOKEN_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_tokens)
+
+        # Lazy comment rendering: scroll steps arm one deferred depth check
+        self._scroll_check = QTimer(self)
+        self._scroll_check.setSingleShot(True)
+        self._scroll_check.setInterval(MORE_CHECK_MS)
+        self._scroll_check.timeout.connect(self._maybe_render_more)
+
+        # A batch is built in chunks, yielding to the event loop in between
+        self._render_target: int = 0  # row count the current batch renders up to
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(0)
+        self._render_timer.timeout.connect(self._render_chunk)
+
+        # Debounced post fetch (last subreddit/sort selection wins)
+        self._pending_subreddit: Optional[str] = None
+        self._fetch_debounce = QTimer(self)
+        self._fetch_debounce.setSingleShot(True)
+        self._fetch_debounce.setInterval(FETCH_DEBOUNCE_MS)
+        self._fetch_debounce.timeout.connect(self._do_fetch_posts)
 
     # ------------------------------------------------------------------
     # UI Construction
@@ -83,6 +261,7 @@ class ReaderWidget(QWidget):
 
     def _init_ui(self):
         """Build the full reader layout."""
+        self.setStyleSheet(_READER_QSS)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
@@ -108,8 +287,13 @@ class ReaderWidget(QWidget):
         panel_layout.addLayout(post_header)
 
         # -- Post list --
-        self._post_list = QListWidget()
-        self._post_list.currentRowChanged.connect(self._on_post_selected)
+        # Rows are formatted lazily by the model, so only visible ones cost anything
+        self._post_model = PostListModel(self)
+        self._post_list = QListView()
+        self._post_list.setModel(self._post_model)
+        self._post_list.selectionModel().currentRowChanged.connect(
+            lambda current, _previous: self._on_post_selected(current.row())
+        )
         self._post_list.setMaximumHeight(200)
         panel_layout.addWidget(self._post_list)
 
@@ -169,14 +353,15 @@ class ReaderWidget(QWidget):
         comments_header.addStretch()
         content_layout.addLayout(comments_header)
 
-        # Container layout for dynamically-added comment widgets
-        self._comments_area = QVBoxLayout()
-        content_layout.addLayout(self._comments_area)
+        # Container for dynamically-added comment widgets (swapped out on clear)
+        self._content_layout = content_layout
+        self._comments_container, self._comments_area = self._new_comments_container()
+        content_layout.addWidget(self._comments_container)
         content_layout.addStretch()
 
         content_area.setWidget(content_widget)
-        content_area.verticalScrollBar().valueChanged.connect(self._on_content_scroll)
         self._content_scroll = content_area
+        content_area.verticalScrollBar().valueChanged.connect(self._on_content_scroll)
         panel_layout.addWidget(content_area)
 
         return panel
@@ -188,12 +373,23 @@ class ReaderWidget(QWidget):
     def load_subreddit(self, name: str):
         """Load posts from a subreddit (called by MainWindow via TopBar signal)."""
         self._current_subreddit = name
-        self._fetch_posts(name)
+        self._schedule_fetch(name)
 
     def _on_sort_changed(self, _sort_text: str):
         """Re-fetch posts when sort order changes."""
         if self._current_subreddit:
-            self._fetch_posts(self._current_subreddit)
+            self._schedule_fetch(self._current_subreddit)
+
+    def _schedule_fetch(self, subreddit: str):
+        """Restart the debounce timer; only the last request within the window fetches."""
+        self._pending_subreddit = subreddit
+        self._fetch_debounce.start()
+
+    def _do_fetch_posts(self):
+        """Fetch posts for the most recently requested subreddit."""
+        subreddit, self._pending_subreddit = self._pending_subreddit, None
+        if subreddit:
+            self._fetch_posts(subreddit)
 
     def _fetch_posts(self, subreddit: str):
         """Start async post fetch via RedditFetchWorker.
@@ -201,48 +397,75 @@ class ReaderWidget(QWidget):
         Clears existing UI state immediately and shows loading indicator.
         """
         # Clear right panel state
-        self._post_list.clear()
+        self._set_posts([])
         self._translation_text.clear()
         self._original_text.clear()
         self._write_comment_btn.setEnabled(False)
         self._clear_comments()
+        self._comments_post_id = ""
         self._current_posts = []
         self._current_post = None
 
         # Stop ALL running workers (prevents stale results from previous subreddit)
-        for worker in (self._fetch_worker, self._gen_worker, self._title_worker,
-                       self._comment_worker, self._comment_translate_worker):
-            if worker is not None and worker.isRunning():
-                worker.stop()
-                worker.wait(2000)
+        self._scheduler.cancel_group("reader")
+        self._scheduler.cancel_group("reader_prefetch")
 
-        self._fetch_worker = RedditFetchWorker(self._reader)
-        self._fetch_worker.posts_ready.connect(self._on_posts_ready)
-        self._fetch_worker.error_occurred.connect(self._on_fetch_error)
+        worker, gen = self._new_fetch_worker()
+        worker.posts_ready.connect(self._if_current(gen, self._on_posts_ready))
+        worker.error_occurred.connect(self._if_current(gen, self._on_fetch_error))
 
         sort = self._sort_combo.currentText().lower()
-        self._fetch_worker.fetch_posts(subreddit, sort=sort)
-        self._fetch_worker.start()
+        worker.fetch_posts(subreddit, sort=sort)
+        worker.start()
 
         self._posts_label.setText(self._i18n.get("reader.loading"))
 
+    def _new_fetch_worker(self) -> tuple[RedditFetchWorker, int]:
+        """Stop in-flight fetches and create a worker for a new generation.
+
+        Nothing waits on the old threads: they are only asked to stop, and
+        anything they still emit is dropped by _if_current. Each worker
+        removes itself from _active_workers and is deleted once it exits.
+        """
+        self._worker_generation += 1
+        for old in self._active_workers:
+            old.stop()
+
+        worker = RedditFetchWorker(self._reader, parent=self)
+        self._active_workers.add(worker)
+        worker.finished.connect(lambda w=worker: self._active_workers.discard(w))
+        worker.finished.connect(worker.deleteLater)
+        return worker, self._worker_generation
+
+    def _if_current(self, gen: int, slot):
+        """Wrap *slot* so it is ignored once a newer fetch has started."""
+        def call(*args):
+            if gen == self._worker_generation:
+                slot(*args)
+        return call
+
+    def _set_posts(self, posts: list[PostDTO]):
+        """Replace the post rows without firing selection slots.
+
+        The model reset drops the current row; blocking the selection model
+        keeps that from reaching _on_post_selected as a stray row change.
+        """
+        with QSignalBlocker(self._post_list.selectionModel()):
+            self._post_model.set_posts(posts)
+            self._post_list.setCurrentIndex(self._post_model.index(-1))
+
     def _on_posts_ready(self, posts: list):
         """Populate post list when async fetch completes, then start title translation."""
         self._current_posts = posts
-        self._post_list.clear()
-        self._translated_titles = {}
+        self._set_posts(posts)
         self._posts_label.setText(self._i18n.get("reader.posts"))
 
         if not posts:
             self._posts_label.setText(self._i18n.get("reader.no_posts"))
             return
 
-        for post in posts:
-            item_text = f"{post.title}  [\u2191{post.score}]  [\U0001f4ac{post.num_comments}]"
-            self._post_list.addItem(item_text)
-
         # Start title translation (async)
-        locale = self._config.get("app.locale", "ko_KR")
+        locale = self._locale
         if locale == "ko_KR":
             self._start_title_translation(posts)
 
@@ -255,59 +478,59 @@ class ReaderWidget(QWidget):
     # ------------------------------------------------------------------
 
     def _start_title_translation(self, posts: list[PostDTO]):
-        """Start async batch title translation (coordinator-aware)."""
+        """Show cached title translations and queue the rest (lowest priority)."""
+        locale = self._locale
+        missing_rows: list[int] = []
+        for row, post in enumerate(posts):
+            cached = self._reader.get_title_translation(post.id, locale=locale)
+            if cached:
+                self._post_model.set_translation(row, cached)
+            else:
+                missing_rows.append(row)
+
+        if not missing_rows:
+            return
         # Silent skip if model not configured
         if not self._check_model_configured("logic", show_dialog=False):
             return
 
-        if self._title_worker and self._title_worker.isRunning():
-            self._title_worker.stop()
-            self._title_worker.wait(2000)
-
-        task_id = "reader_title_translate"
+        titles = [posts[row].title for row in missing_rows]
 
-        def do_start():
+        def setup(worker: GenerationWorker) -> bool:
             self.activity_started.emit(self._i18n.get("status.reader_titles"))
-            titles = [p.title for p in self._current_posts]
-            if not titles:
-                return
-            self._title_worker = GenerationWorker()
-            self._title_worker.finished_signal.connect(self._on_titles_translated)
-            self._title_worker.error_occurred.connect(self._on_title_translate_error)
-            locale = self._config.get("app.locale", "ko_KR")
-            self._title_worker.configure(self._reader.translate_titles, titles, locale=locale)
-            self._title_worker.start()
-
-        if not self._coordinator.request_normal(task_id, do_start):
-            return  # queued, will be called back when exclusive finishes
-        do_start()
-
-    def _on_titles_translated(self, full_text: str):
-        """Parse numbered translations and update post list items."""
-        self._coordinator.finish_normal("reader_title_translate")
+            worker.finished_signal.connect(
+                lambda text: self._on_titles_translated(text, missing_rows)
+            )
+            worker.error_occurred.connect(self._on_title_translate_error)
+            worker.configure(self._reader.translate_titles, titles, locale=locale)
+            return True
+
+        self._scheduler.submit(
+            PRIORITY_TITLES, "reader_title_translate", setup, cancel_group="reader",
+            on_cancel=lambda: self.activity_finished.emit(self._i18n.get("status.reader_titles")),
+        )
+
+    def _on_titles_translated(self, full_text: str, rows: list[int]):
+        """Parse numbered translations, update post list items and cache them.
+
+        Args:
+            full_text: Numbered LLM output ("1. ...", "2. ...").
+            rows: Post list row of each numbered title, in prompt order.
+        """
         self.activity_finished.emit(self._i18n.get("status.reader_titles"))
-        lines = full_text.strip().split("\n")
-        for line in lines:
-            line = line.strip()
-            if not line:
+        locale = self._locale
+        # Parse "1. translated title" format
+        for m in _TITLE_RE.finditer(full_text):
+            number = int(m.group(1))
+            if not 1 <= number <= len(rows):
                 continue
-            # Parse "1. translated title" format
-            dot_pos = line.find(". ")
-            if dot_pos > 0:
-                try:
-                    idx = int(line[:dot_pos]) - 1  # 1-based to 0-based
-                    translated = line[dot_pos + 2:]
-                    if 0 <= idx < self._post_list.count():
-                        self._translated_titles[idx] = translated
-                        post = self._current_posts[idx]
-                        item_text = f"{translated}\n{post.title}  [\u2191{post.score}]  [\U0001f4ac{post.num_comments}]"
-                        self._post_list.item(idx).setText(item_text)
-                except (ValueError, IndexError):
-                    continue
+            row = rows[number - 1]
+            translated = m.group(2).strip()
+            self._post_model.set_translation(row, translated)
+            self._reader.save_title_translation(self._current_posts[row].id, translated, locale=locale)
 
     def _on_title_translate_error(self, error_key: str):
         """Title translation failed - just log, posts still show English titles."""
-        self._coordinator.finish_normal("reader_title_translate")
         self.activity_finished.emit(self._i18n.get("status.reader_titles"))
         logger.warning(f"Title translation failed: {error_key}")
 
@@ -333,8 +556,8 @@ class ReaderWidget(QWidget):
         self._write_comment_btn.setEnabled(True)
 
         # Translation: check cache first
-        locale = self._config.get("app.locale", "ko_KR")
-        cached = self._reader.get_translation(post.id, locale=locale)
+        locale = self._locale
+        cached = self._get_translation(post.id, locale)
         if cached:
             self._translation_text.setPlainText(cached)
         elif locale == "ko_KR" and post.selftext:
@@ -346,10 +569,73 @@ class ReaderWidget(QWidget):
         # Comments (separate async request)
         self._fetch_comments(post.id, post.subreddit)
 
+        if locale == "ko_KR":
+            self._prefetch_neighbors(row, locale)
+
+    def _prefetch_neighbors(self, row: int, locale: str):
+        """Queue background body translations for posts next to *row*.
+
+        Runs at the lowest priority so anything the user is looking at
+        preempts it; results land in the DB cache used by _on_post_selected.
+        """
+        self._scheduler.cancel_group("reader_prefetch")
+        if not self._check_model_configured("logic", show_dialog=False):
+            return
+
+        for offset in PREFETCH_OFFSETS:
+            if self._scheduler.pending_count("reader_prefetch") >= PREFETCH_MAX_JOBS:
+                break
+            idx = row + offset
+            if not 0 <= idx < len(self._current_posts):
+                continue
+            post = self._current_posts[idx]
+            if not post.selftext or self._get_translation(post.id, locale):
+                continue
+
+            def setup(worker: GenerationWorker, post=post) -> bool:
+                worker.finished_signal.connect(
+                    lambda text, key=(post.id, locale): self._remember_translation(key, text)
+                )
+                worker.configure(self._reader.generate_translation, post, locale=locale)
+                return True
+
+            self._scheduler.submit(
+                PRIORITY_PREFETCH, f"reader_prefetch_{post.id}", setup,
+                cancel_group="reader_prefetch",
+            )
+
+    def _get_translation(self, post_id: str, locale: str) -> Optional[str]:
+        """Return a post body translation from the LRU cache, else from the DB."""
+        key = (post_id, locale)
+        cached = self._trans_cache.get(key)
+        if cached is not None:
+            self._trans_cache.move_to_end(key)
+            return cached
+        cached = self._reader.get_translation(post_id, locale=locale)
+        if cached:
+            self._remember_translation(key, cached)
+        return cached
+
+    def _remember_translation(self, key: tuple[str, str], text: str):
+        """Store a body translation in the LRU cache, evicting the oldest."""
+        self._trans_cache[key] = text
+        self._trans_cache.move_to_end(key)
+        if len(self._trans_cache) > TRANSLATION_CACHE_SIZE:
+            self._trans_cache.popitem(last=False)
+
     # ------------------------------------------------------------------
     # Translation generation (streaming)
     # ------------------------------------------------------------------
 
+    def _on_config_changed(self, key: str, value):
+        """Refresh cached settings when ConfigManager changes them."""
+        if key == "app.locale":
+            self._locale = value
+        elif key == "llm.models.logic.name":
+            self._logic_model_name = value
+        elif key == "llm.models.logic.num_ctx":
+            self._logic_num_ctx = value
+
     def _check_model_configured(self, role: str, show_dialog: bool = True) -> bool:
         """Check if a model role is configured.
 
@@ -390,50 +676,70 @@ class ReaderWidget(QWidget):
         return False
 
     def _generate_translation(self, post: PostDTO):
-        """Start async post body translation via GenerationWorker."""
-        if self._gen_worker is not None and self._gen_worker.isRunning():
-            self._gen_worker.stop()
-            self._gen_worker.wait(2000)
-
+        """Start async post body translation (highest priority, preempts others)."""
         if not self._check_model_configured("logic", show_dialog=True):
             return
 
-        task_id = "reader_translation"
         self._translation_text.clear()
         self._translation_text.setPlaceholderText(self._i18n.get("reader.translating"))
 
-        def do_start():
+        def setup(worker: GenerationWorker) -> bool:
             self._start_loading_animation(self._translation_text)
             self.activity_started.emit(self._i18n.get("status.reader_translation"))
-            self._gen_worker = GenerationWorker()
-            self._gen_worker.token_received.connect(self._on_translation_token)
-            self._gen_worker.finished_signal.connect(self._on_translation_finished)
-            self._gen_worker.error_occurred.connect(self._on_translation_error)
-            locale = self._config.get("app.locale", "ko_KR")
-            self._gen_worker.configure(self._reader.generate_translation, post, locale=locale)
-            self._gen_worker.start()
-
-        if not self._coordinator.request_normal(task_id, do_start):
-            return
-        do_start()
+            locale = self._locale
+            worker.tokens_ready.connect(
+                lambda w=worker: self._on_translation_tokens(w.drain_tokens())
+            )
+            worker.finished_signal.connect(
+                lambda text, key=(post.id, locale): self._remember_translation(key, text)
+            )
+            worker.finished_signal.connect(self._on_translation_finished)
+            worker.error_occurred.connect(self._on_translation_error)
+            worker.configure(self._reader.generate_translation, post, locale=locale)
+            return True
 
-    def _on_translation_token(self, token: str):
-        """Append a streamed token to the translation text edit."""
-        self._stop_loading_animation()
-        self._translation_text.setPlaceholderText("")
+        def on_cancel():
+            self._discard_tokens()
+            self._stop_loading_animation()
+            self.activity_finished.emit(self._i18n.get("status.reader_translation"))
+
+        self._scheduler.submit(
+            PRIORITY_POST_BODY, "reader_translation", setup,
+            cancel_group="reader", on_cancel=on_cancel,
+        )
+
+    def _on_translation_tokens(self, tokens: list[str]):
+        """Buffer streamed tokens; they are appended on the next flush."""
+        if self._anim_active:
+            # First tokens of the stream: drop the loading indicator once
+            self._stop_loading_animation()
+        self._token_buffer.extend(tokens)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_tokens(self):
+        """Append all buffered tokens to the translation text edit at once."""
+        if not self._token_buffer:
+            return
         cursor = self._translation_text.textCursor()
         cursor.movePosition(cursor.MoveOperation.End)
-        cursor.insertText(token)
+        cursor.insertText("".join(self._token_buffer))
+        self._token_buffer.clear()
+
+    def _discard_tokens(self):
+        """Drop buffered tokens of a stream that ended or was cancelled."""
+        self._flush_timer.stop()
+        self._token_buffer.clear()
 
     def _on_translation_finished(self, full_text: str):
         """Replace streaming text with final complete translation."""
-        self._coordinator.finish_normal("reader_translation")
+        self._discard_tokens()  # full_text already contains them
         self._translation_text.setPlainText(full_text)
         self.activity_finished.emit(self._i18n.get("status.reader_translation"))
 
     def _on_translation_error(self, error_key: str):
         """Show localized error when translation fails."""
-        self._coordinator.finish_normal("reader_translation")
+        self._discard_tokens()
         self._stop_loading_animation()
         self.activity_finished.emit(self._i18n.get("status.reader_translation"))
         self._translation_text.setPlaceholderText("")
@@ -443,7 +749,8 @@ class ReaderWidget(QWidget):
         """Delete cached translation and regenerate."""
         if self._current_post is None:
             return
-        locale = self._config.get("app.locale", "ko_KR")
+        locale = self._locale
+        self._trans_cache.pop((self._current_post.id, locale), None)
         self._reader.delete_translation(self._current_post.id, locale=locale)
         self._generate_translation(self._current_post)
 
@@ -462,92 +769,155 @@ class ReaderWidget(QWidget):
     # ------------------------------------------------------------------
 
     def _fetch_comments(self, post_id: str, subreddit: str):
-        """Start async comment fetch via a dedicated RedditFetchWorker."""
-        self._clear_comments()
-
-        # Stop previous comment worker if still running
-        if self._comment_worker is not None and self._comment_worker.isRunning():
-            self._comment_worker.stop()
-            self._comment_worker.wait(2000)
+        """Start async comment fetch via a fresh RedditFetchWorker.
 
-        self._comment_worker = RedditFetchWorker(self._reader)
-        self._comment_worker.comments_ready.connect(self._on_comments_ready)
-        self._comment_worker.error_occurred.connect(self._on_fetch_error)
-        self._comment_worker.fetch_comments(post_id, subreddit)
-        self._comment_worker.start()
+        Frames of the same post are kept until the new comments arrive so
+        that _on_comments_ready can reuse the unchanged ones.
+        """
+        if post_id != self._comments_post_id:
+            # A batch for the previous post must not advance this post's cursor
+            self._scheduler.cancel("reader_comment_translate")
+            self._clear_comments()
+            self._flat_comments = []
+            self._comment_translations = []
+            self._comment_frames = []
+            self._comment_index = {}
+            self._rendered_comment_count = 0
+            self._translated_comment_count = 0
+        self._comments_post_id = post_id
+
+        # Supersedes the previous comment fetch without waiting for it
+        worker, gen = self._new_fetch_worker()
+        worker.comments_ready.connect(self._if_current(gen, self._on_comments_ready))
+        worker.error_occurred.connect(self._if_current(gen, self._on_fetch_error))
+        worker.fetch_comments(post_id, subreddit)
+        worker.start()
 
     def _on_comments_ready(self, comments: list):
-        """Store comments and render first batch with lazy loading."""
-        self._clear_comments()
-        self._comments_list = comments
-        self._rendered_comment_count = 0
-        self._translated_comment_count = 0
-        # Render first batch
-        self._render_next_batch()
+        """Flatten the comment tree once and render the first batch of rows.
+
+        Already-rendered rows that are unchanged (same id, body and depth)
+        keep their frames and translations; only the stale tail is torn down.
+        """
+        flat = list(_walk(comments))
+        reused = 0
+        limit = min(self._rendered_comment_count, len(flat))
+        while reused < limit and _row_key(flat[reused]) == _row_key(self._flat_comments[reused]):
+            reused += 1
+
+        previous = self._rendered_comment_count
+        self._clear_comments(keep=reused)
+        fresh = [None] * (len(flat) - reused)
+        self._comment_translations = self._comment_translations[:reused] + fresh
+        self._comment_frames = self._comment_frames[:reused] + fresh
+        self._comment_index = {comment.id: row for row, (comment, _) in enumerate(flat)}
+        self._flat_comments = flat
+        self._rendered_comment_count = reused
+        self._translated_comment_count = min(self._translated_comment_count, reused)
+
+        if reused and reused == previous:
+            # Everything shown before is still valid: just restore the indicator
+            self._update_more_indicator()
+            if self._locale == "ko_KR":
+                self._translate_all_visible_comments()
+        else:
+            # Render first (or next) batch
+            self._render_next_batch()
 
     def _render_next_batch(self):
-        """Render next COMMENTS_RENDER_BATCH top-level comments + auto-translate."""
-        start = self._rendered_comment_count
-        end = min(start + COMMENTS_RENDER_BATCH, len(self._comments_list))
+        """Render the next COMMENTS_RENDER_BATCH comment rows + auto-translate.
 
-        if start >= len(self._comments_list):
+        Rows come from the flattened tree, so a top-level comment with a
+        large reply subtree only materializes one batch of frames at a time.
+        The batch is built COMMENTS_RENDER_CHUNK rows per event-loop turn,
+        so the post body paints before a large thread is fully laid out.
+        """
+        start = self._rendered_comment_count
+        if start >= len(self._flat_comments):
             return
+        self._render_target = min(start + COMMENTS_RENDER_BATCH, len(self._flat_comments))
+        self._render_chunk()
 
-        # Remove "..." indicator if it exists
-        if hasattr(self, '_more_indicator') and self._more_indicator is not None:
-            self._more_indicator.deleteLater()
-            self._more_indicator = None
+    def _render_chunk(self):
+        """Render the next chunk of the current batch; finish the batch at its end."""
+        start = self._rendered_comment_count
+        end = min(start + COMMENTS_RENDER_CHUNK, self._render_target)
+        if start >= end:
+            return
 
-        for i in range(start, end):
-            comment = self._comments_list[i]
-            self._add_comment_widget(comment, self._comments_area, depth=0)
+        # Hold repaints until the whole chunk is in: one layout pass, not one per frame
+        container = self._comments_container
+        container.setUpdatesEnabled(False)
+        try:
+            # Remove "..." indicator if it exists
+            if hasattr(self, '_more_indicator') and self._more_indicator is not None:
+                self._comments_area.removeWidget(self._more_indicator)
+                self._more_indicator.deleteLater()
+                self._more_indicator = None
+
+            for row in range(start, end):
+                comment, depth = self._flat_comments[row]
+                self._add_comment_widget(comment, self._comments_area, depth, row)
+
+            self._rendered_comment_count = end
+            if end == self._render_target:
+                self._update_more_indicator()
+        finally:
+            container.setUpdatesEnabled(True)
+        container.updateGeometry()
+
+        if end < self._render_target:
+            self._render_timer.start()
+            return
 
-        self._rendered_comment_count = end
+        # Auto-translate the rendered batch
+        locale = self._locale
+        if locale == "ko_KR":
+            self._translate_all_visible_comments()
 
-        # Add "..." indicator if more comments available
-        if end < len(self._comments_list):
+    def _update_more_indicator(self):
+        """Add "..." indicator if more comments available."""
+        if self._rendered_comment_count < len(self._flat_comments):
             self._more_indicator = QLabel("···")
-            self._more_indicator.setStyleSheet("color: #888; font-size: 18px; padding: 8px;")
+            self._more_indicator.setObjectName("moreIndicator")
             self._more_indicator.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self._comments_area.addWidget(self._more_indicator)
+            self._scroll_check.start()  # the batch may not fill the view
         else:
             self._more_indicator = None
-
-        # Auto-translate the rendered batch
-        locale = self._config.get("app.locale", "ko_KR")
-        if locale == "ko_KR":
-            self._translate_next_comments_batch()
+            self._scroll_check.stop()
 
     def _add_comment_widget(
         self,
         comment: CommentDTO,
         parent_layout: QVBoxLayout,
         depth: int,
+        row: int,
     ):
-        """Add a comment frame with optional reply button and child translate buttons.
+        """Add a single comment frame with optional reply button and translate button.
 
-        Rendering is capped at MAX_COMMENT_DEPTH (spec 7.2).
+        Children are not rendered here; callers iterate the tree with _walk,
+        which caps rendering at MAX_COMMENT_DEPTH (spec 7.2).
 
         Args:
             comment: CommentDTO to render.
             parent_layout: Layout to append the comment frame into.
             depth: Current nesting depth (0 = top-level).
+            row: Position of the comment in _flat_comments.
         """
-        if depth > MAX_COMMENT_DEPTH:
-            return
 
         frame = QFrame()
         frame.setFrameShape(QFrame.Shape.StyledPanel)
         frame_layout = QVBoxLayout(frame)
         frame_layout.setContentsMargins(depth * 20, 4, 4, 4)
 
-        self._comment_widgets[comment.id] = frame
+        self._comment_frames[row] = frame
 
         if comment.more_count > 0:
             more_label = QLabel(
                 self._i18n.get("reader.more_comments", count=str(comment.more_count))
             )
-            more_label.setStyleSheet("color: gray; font-style: italic;")
+            more_label.setObjectName("moreLabel")
             more_label.setEnabled(False)
             frame_layout.addWidget(more_label)
         else:
@@ -559,17 +929,18 @@ class ReaderWidget(QWidget):
             # Reply button for all comments
             reply_btn = QPushButton(self._i18n.get("reader.write_reply"))
             reply_btn.setFixedHeight(24)
-            reply_btn.setStyleSheet("font-size: 11px; padding: 2px 8px;")
-            reply_btn.clicked.connect(lambda checked, c=comment: self._on_write_reply(c))
+            reply_btn.setObjectName("replyBtn")
+            # partial rather than a closure per row; the slot takes clicked's checked arg
+            reply_btn.clicked.connect(partial(self._on_write_reply, comment))
             header_layout.addWidget(reply_btn)
 
             # Translate button for child comments (depth > 0)
             if depth > 0:
                 translate_btn = QPushButton(self._i18n.get("reader.translate_comment_btn"))
                 translate_btn.setFixedHeight(24)
-                translate_btn.setStyleSheet("font-size: 11px; padding: 2px 8px;")
+                translate_btn.setObjectName("translateBtn")
                 translate_btn.clicked.connect(
-                    lambda checked, c=comment, btn=translate_btn: self._on_translate_single_comment(c, btn)
+                    partial(self._on_translate_single_comment, comment, translate_btn)
                 )
                 header_layout.addWidget(translate_btn)
 
@@ -579,152 +950,192 @@ class ReaderWidget(QWidget):
             body.setWordWrap(True)
             frame_layout.addWidget(body)
 
+        # Re-apply a translation that arrived before (or survived) this frame
+        translation = self._comment_translations[row]
+        if translation:
+            self._show_comment_translation(frame, translation)
+
         parent_layout.addWidget(frame)
 
-        for child in comment.children:
-            self._add_comment_widget(child, parent_layout, depth + 1)
+    @staticmethod
+    def _new_comments_container() -> tuple[QWidget, QVBoxLayout]:
+        """Create an empty comments container and its layout."""
+        container = QWidget()
+        area = QVBoxLayout(container)
+        area.setContentsMargins(0, 0, 0, 0)
+        return container, area
 
-    def _clear_comments(self):
-        """Remove all dynamically-added comment widgets from the comments area."""
-        while self._comments_area.count():
-            item = self._comments_area.takeAt(0)
-            widget = item.widget()
+    def _clear_comments(self, keep: int = 0):
+        """Remove dynamically-added comment widgets from the comments area.
+
+        A full clear swaps in a fresh container and deletes the old one in
+        a single deleteLater, instead of tearing down frames one by one.
+
+        Args:
+            keep: Number of leading rows whose frames should stay in place.
+        """
+        indicator, self._more_indicator = self._more_indicator, None
+        self._render_timer.stop()
+        self._render_target = 0
+        if not keep:
+            old = self._comments_container
+            index = self._content_layout.indexOf(old)
+            self._content_layout.removeWidget(old)
+            old.hide()
+            old.deleteLater()
+            self._comments_container, self._comments_area = self._new_comments_container()
+            self._content_layout.insertWidget(index, self._comments_container)
+            self._comment_frames = [None] * len(self._comment_frames)
+            return
+
+        stale = self._comment_frames[keep:]
+        if indicator is not None:
+            stale.append(indicator)
+        for widget in stale:
             if widget is not None:
+                self._comments_area.removeWidget(widget)
                 widget.deleteLater()
-        self._comment_widgets.clear()
+        self._comment_frames[keep:] = [None] * (len(self._comment_frames) - keep)
 
     # ------------------------------------------------------------------
     # Comment translation
     # ------------------------------------------------------------------
 
-    def _translate_next_comments_batch(self):
-        """Translate the next batch of comments (coordinator-aware)."""
+    def _translate_all_visible_comments(self):
+        """Translate untranslated top-level comments in one streaming request.
+
+        Starts at the first untranslated rendered row and packs as many
+        top-level comments (rendered or not) as fit the context budget.
+        Translations are applied as each numbered entry completes.
+        """
         # Silent skip if model not configured
         if not self._check_model_configured("logic", show_dialog=False):
             return
 
-        # Collect untranslated top-level comment bodies
-        start = self._translated_comment_count
-        end = min(start + COMMENTS_RENDER_BATCH, len(self._comments_list))
-
-        if start >= len(self._comments_list):
+        start = end = self._translated_comment_count
+        if start >= self._rendered_comment_count:
             return
 
-        comments_to_translate = self._comments_list[start:end]
-        bodies = [c.body for c in comments_to_translate if c.body and c.more_count == 0]
-
-        if not bodies:
+        batch: list[CommentDTO] = []
+        used = 0
+        max_chars = _comment_prompt_max_chars(self._logic_num_ctx)
+        for comment, depth in islice(self._flat_comments, start, None):
+            if depth == 0 and comment.body and comment.more_count == 0:
+                cost = len(comment.body) + 10  # "[N] " and "\n---\n" separators
+                if batch and used + cost > max_chars:
+                    break
+                batch.append(comment)
+                used += cost
+            end += 1
+
+        if not batch:
             self._translated_comment_count = end
             return
 
-        task_id = "reader_comment_translate"
+        bodies = [c.body for c in batch]
+        comment_ids = [c.id for c in batch]
+        post_id = self._comments_post_id
 
-        def do_start():
+        def setup(worker: GenerationWorker) -> bool:
             self.activity_started.emit(self._i18n.get("status.reader_comments"))
 
-            # Batch translate using a combined prompt
-            combined = "\n---\n".join(f"[{i+1}] {b}" for i, b in enumerate(bodies))
-            prompt_text = (
-                f"Translate each numbered Reddit comment below to Korean.\n"
-                f"\n"
-                f"Rules:\n"
-                f"- Keep the same numbering [1] [2] [3]...\n"
-                f"- Preserve tone and style\n"
-                f"- Output ONLY the numbered translations\n"
-                f"\n"
-                f"{combined}"
-            )
+            # Batch translate using a combined prompt, assembled in one join
+            prompt_text = "".join([
+                _COMMENT_PROMPT_PREFIX,
+                "\n---\n".join(f"[{i}] {b}" for i, b in enumerate(bodies, 1)),
+            ])
 
-            if self._comment_translate_worker and self._comment_translate_worker.isRunning():
-                self._comment_translate_worker.stop()
-                self._comment_translate_worker.wait(2000)
-
-            self._comment_translate_worker = GenerationWorker()
-            self._comment_translate_worker.finished_signal.connect(
-                lambda text: self._on_comments_translated(text, start, end)
+            parser = _NumberedStreamParser()
+            worker.configure_post_process(parser.feed, parser.close)
+            worker.parsed_signal.connect(
+                lambda entries: self._apply_comment_translations(entries, comment_ids)
             )
-            self._comment_translate_worker.error_occurred.connect(self._on_comment_translate_error)
-
-            self._comment_translate_worker.configure(
+            worker.finished_signal.connect(partial(self._on_comments_translated, post_id, end))
+            worker.error_occurred.connect(self._on_comment_translate_error)
+            worker.configure(
                 self._reader._llm.generate,
                 prompt=prompt_text,
-                model=self._config.get("llm.models.logic.name", ""),
-                num_ctx=8192,
+                model=self._logic_model_name,
+                num_ctx=self._logic_num_ctx,
             )
-            self._comment_translate_worker.start()
+            return True
+
+        self._scheduler.submit(
+            PRIORITY_COMMENTS, "reader_comment_translate", setup, cancel_group="reader",
+            on_cancel=lambda: self.activity_finished.emit(self._i18n.get("status.reader_comments")),
+        )
+
+    def _on_comments_translated(self, post_id: str, end: int, _text: str):
+        """Continue with untranslated rows once a batch request is done.
 
-        if not self._coordinator.request_normal(task_id, do_start):
-            return  # queued
-        do_start()
+        The worker has already delivered every parsed entry via parsed_signal,
+        so the raw response text from finished_signal is ignored.
 
-    def _on_comments_translated(self, full_text: str, start: int, end: int):
-        """Parse translated comments and add translation labels to comment widgets."""
-        self._coordinator.finish_normal("reader_comment_translate")
+        Args:
+            post_id: Post whose comments the batch translated.
+            end: Row cursor to resume translation from.
+        """
         self.activity_finished.emit(self._i18n.get("status.reader_comments"))
+        if post_id != self._comments_post_id:
+            return  # stale batch from a previously shown post
         self._translated_comment_count = end
 
-        # Parse translations by [N] markers
-        translations = {}
-        current_idx = None
-        current_text = []
-        for line in full_text.strip().split("\n"):
-            line = line.strip()
-            # Check for [N] pattern
-            if line.startswith("[") and "]" in line:
-                bracket_end = line.index("]")
-                try:
-                    idx = int(line[1:bracket_end])
-                    if current_idx is not None:
-                        translations[current_idx] = " ".join(current_text).strip()
-                    current_idx = idx
-                    current_text = [line[bracket_end + 1:].strip()]
-                except ValueError:
-                    if current_idx is not None:
-                        current_text.append(line)
-            else:
-                if current_idx is not None:
-                    current_text.append(line)
+        # Keep going until every rendered top-level comment is translated
+        if self._translated_comment_count < self._rendered_comment_count:
+            self._translate_all_visible_comments()
 
-        if current_idx is not None:
-            translations[current_idx] = " ".join(current_text).strip()
+    def _apply_comment_translations(self, entries: dict[int, str], comment_ids: list[str]):
+        """Attach parsed "[N]" entries to the Nth comment of the request."""
+        for number, translation in entries.items():
+            if 1 <= number <= len(comment_ids):
+                row = self._comment_index.get(comment_ids[number - 1])
+                if row is not None:
+                    self._add_translation_to_comment(row, translation)
 
-        # Apply translations to comment widgets by comment ID
-        body_idx = 0
-        for i in range(start, end):
-            if i >= len(self._comments_list):
-                break
-            comment = self._comments_list[i]
-            if not comment.body or comment.more_count > 0:
-                continue
-            body_idx += 1
-            translation = translations.get(body_idx, "")
-            if translation:
-                self._add_translation_to_comment(comment.id, translation)
-
-    def _add_translation_to_comment(self, comment_id: str, translation: str):
-        """Add a translation label below a comment widget."""
-        frame = self._comment_widgets.get(comment_id)
-        if frame is None:
+    def _add_translation_to_comment(self, row: int, translation: str):
+        """Remember a comment translation and show it if the frame is rendered.
+
+        Args:
+            row: Position of the comment in _flat_comments.
+            translation: Translated comment text.
+        """
+        self._comment_translations[row] = translation
+        frame = self._comment_frames[row]
+        if frame is not None:
+            self._show_comment_translation(frame, translation)
+
+    def _show_comment_translation(self, frame: QFrame, translation: str):
+        """Show a translation below a comment frame's body.
+
+        The separator, header and label are added on the first translation
+        only; later ones (re-translation, locale switch) just replace the text.
+        """
+        trans_label: Optional[QLabel] = getattr(frame, "_trans_label", None)
+        if trans_label is not None:
+            trans_label.setText(translation)
             return
         frame_layout = frame.layout()
         if frame_layout:
             sep = QFrame()
             sep.setFrameShape(QFrame.Shape.HLine)
-            sep.setStyleSheet("color: #555;")
+            sep.setObjectName("transSep")
             frame_layout.addWidget(sep)
 
             trans_header = QLabel(self._i18n.get("reader.comment_translation"))
-            trans_header.setStyleSheet("color: #4fc3f7; font-size: 11px; font-weight: bold;")
+            trans_header.setObjectName("transHeader")
             frame_layout.addWidget(trans_header)
 
-            trans_label = QLabel(translation)
+            trans_label = QLabel()
+            # Plain text: no rich-text sniffing or HTML layout of LLM output
+            trans_label.setTextFormat(Qt.TextFormat.PlainText)
             trans_label.setWordWrap(True)
-            trans_label.setStyleSheet("color: #ccc;")
+            trans_label.setObjectName("transLabel")
+            trans_label.setText(translation)
             frame_layout.addWidget(trans_label)
+            frame._trans_label = trans_label
 
     def _on_comment_translate_error(self, error_key: str):
         """Comment translation failed - just log."""
-        self._coordinator.finish_normal("reader_comment_translate")
         self.activity_finished.emit(self._i18n.get("status.reader_comments"))
         logger.warning(f"Comment translation failed: {error_key}")
 
@@ -732,35 +1143,53 @@ class ReaderWidget(QWidget):
     # Single comment translation (on-demand for child comments)
     # ------------------------------------------------------------------
 
-    def _on_translate_single_comment(self, comment: CommentDTO, btn: QPushButton):
+    def _on_translate_single_comment(self, comment: CommentDTO, btn: QPushButton,
+                                     _checked: bool = False):
         """Translate a single child comment on demand."""
         if not self._check_model_configured("logic", show_dialog=False):
             return
         btn.setEnabled(False)
         btn.setText("...")
 
-        worker = GenerationWorker()
-        locale = self._config.get("app.locale", "ko_KR")
-        worker.configure(self._reader.translate_comment, comment.body, locale=locale)
-        worker.finished_signal.connect(
-            lambda text, cid=comment.id, b=btn: self._on_single_comment_translated(cid, text, b)
+        task = GenerationTask(
+            self._reader.translate_comment, comment.body, locale=self._locale, stream=False,
         )
-        worker.error_occurred.connect(
-            lambda err, b=btn: self._on_single_comment_translate_error(b)
+        # The button is only weakly referenced: its frame may be cleared
+        # before the translation arrives
+        btn_ref = weakref.ref(btn)
+        task.signals.finished_signal.connect(
+            partial(self._on_single_comment_translated, comment.id, btn_ref)
         )
-        worker.start()
-        # Keep reference to prevent GC
-        btn._translate_worker = worker
-
-    def _on_single_comment_translated(self, comment_id: str, text: str, btn: QPushButton):
+        task.signals.error_occurred.connect(
+            partial(self._on_single_comment_translate_error, btn_ref)
+        )
+        task.signals.done.connect(partial(self._single_tasks.discard, task))
+        self._single_tasks.add(task)
+        self._translate_pool.start(task)
+
+    @staticmethod
+    def _live_button(btn_ref: weakref.ref) -> Optional[QPushButton]:
+        """Resolve a weak button reference, None if it is gone or deleted."""
+        btn = btn_ref()
+        if btn is None or sip.isdeleted(btn):
+            return None
+        return btn
+
+    def _on_single_comment_translated(self, comment_id: str, btn_ref: weakref.ref, text: str):
         """Handle single comment translation completion."""
-        btn.hide()
-        self._add_translation_to_comment(comment_id, text)
-
-    def _on_single_comment_translate_error(self, btn: QPushButton):
+        btn = self._live_button(btn_ref)
+        if btn is not None:
+            btn.hide()
+        row = self._comment_index.get(comment_id)
+        if row is not None:
+            self._add_translation_to_comment(row, text)
+
+    def _on_single_comment_translate_error(self, btn_ref: weakref.ref, _error_key: str):
         """Handle single comment translation error."""
-        btn.setEnabled(True)
-        btn.setText(self._i18n.get("reader.translate_comment_btn"))
+        btn = self._live_button(btn_ref)
+        if btn is not None:
+            btn.setEnabled(True)
+            btn.setText(self._i18n.get("reader.translate_comment_btn"))
 
     # ------------------------------------------------------------------
     # Write comment / reply handlers
@@ -779,16 +1208,11 @@ class ReaderWidget(QWidget):
         )
         self.write_requested.emit(ctx)
 
-    def _on_write_reply(self, comment: CommentDTO):
+    def _on_write_reply(self, comment: CommentDTO, _checked: bool = False):
         """Handle 'Reply' button click on a comment."""
         if self._current_post is None:
             return
-        # Build parent thread (simplified - just this comment for now)
-        parent_thread = [{
-            "author": comment.author,
-            "body": comment.body,
-            "score": comment.score,
-        }]
+        # Parent thread (simplified - just this comment for now), DTOs by reference
         ctx = WriterContext(
             mode="reply",
             subreddit=self._current_post.subreddit,
@@ -798,7 +1222,7 @@ class ReaderWidget(QWidget):
             comment_id=comment.id,
             comment_body=comment.body,
             comment_author=comment.author,
-            parent_thread=parent_thread,
+            parent_thread=[comment],
         )
         self.write_requested.emit(ctx)
 
@@ -806,30 +1230,60 @@ class ReaderWidget(QWidget):
     # Scroll-based lazy loading
     # ------------------------------------------------------------------
 
-    def _on_content_scroll(self, value: int):
-        """Detect when user scrolls near bottom and render+translate more comments."""
-        scrollbar = self._content_scroll.verticalScrollBar()
-        if scrollbar.maximum() == 0:
+    def _on_content_scroll(self, _value: int):
+        """Throttle scrollbar steps to one _maybe_render_more per MORE_CHECK_MS."""
+        if self._more_indicator is not None and not self._scroll_check.isActive():
+            self._scroll_check.start()
+
+    def _maybe_render_more(self):
+        """Render+translate more comments once scrolled near the bottom."""
+        indicator = self._more_indicator
+        if indicator is None or not indicator.isVisible():
+            return
+        bar = self._content_scroll.verticalScrollBar()
+        maximum = bar.maximum()
+        # Integer ratio test; maximum 0 means everything fits
+        if maximum and bar.value() * MORE_AT_DEN <= maximum * MORE_AT_NUM:
             return
-        if value > scrollbar.maximum() * 0.8:
-            if self._rendered_comment_count < len(self._comments_list):
-                if not (self._comment_translate_worker and self._comment_translate_worker.isRunning()):
-                    self._render_next_batch()
+        if self._scheduler.has_job("reader_comment_translate"):
+            self._scroll_check.start()  # retry once the batch is translated
+            return
+        self._render_next_batch()
 
     # ------------------------------------------------------------------
     # Loading animation
     # ------------------------------------------------------------------
 
     def _start_loading_animation(self, target: QTextEdit):
-        """Start animated loading text in a QTextEdit."""
+        """Start animated loading text over a QTextEdit.
+
+        The dots are drawn by a small QLabel laid over the text edit's
+        viewport, so ticks never touch the edit's placeholder or document.
+        """
         self._anim_target = target
         self._anim_dot_count = 0
+        self._anim_active = True
+        target.setPlaceholderText("")
+
+        if self._anim_label is None:
+            self._anim_label = QLabel()
+            self._anim_label.setObjectName("loadingDots")
+        margin = int(target.document().documentMargin())
+        self._anim_label.setParent(target.viewport())
+        self._anim_label.move(margin, margin)
+        self._build_anim_frames()
+        self._anim_label.show()
+
         self._anim_timer.start()
         self._animate_loading()
 
     def _stop_loading_animation(self):
         """Stop the loading animation."""
-        self._anim_timer.stop()
+        self._anim_active = False
+        if self._anim_timer.isActive():
+            self._anim_timer.stop()
+        if self._anim_label is not None:
+            self._anim_label.hide()
         self._anim_target = None
 
     def _animate_loading(self):
@@ -837,9 +1291,15 @@ class ReaderWidget(QWidget):
         if self._anim_target is None:
             return
         self._anim_dot_count = (self._anim_dot_count + 1) % 4
-        dots = "." * self._anim_dot_count
-        base = self._i18n.get("reader.translating").rstrip(".")
-        self._anim_target.setPlaceholderText(f"{base}{dots}")
+        self._anim_label.setText(self._anim_frames[self._anim_dot_count])
+
+    def _build_anim_frames(self):
+        """Precompute the indicator text for each dot count and size the label."""
+        base = self._i18n.get_cached("reader.translating").rstrip(".")
+        self._anim_frames = tuple(base + "." * i for i in range(4))
+        # Size for the longest frame once; ticks then only swap the text
+        self._anim_label.setText(self._anim_frames[-1])
+        self._anim_label.adjustSize()
 
     # ------------------------------------------------------------------
     # i18n hot-reload
@@ -850,12 +1310,19 @@ class ReaderWidget(QWidget):
 
         Called by MainWindow.retranslate_ui() after I18nManager.load_locale().
         """
-        self._posts_label.setText(self._i18n.get("reader.posts"))
-        self._translation_label.setText(self._i18n.get("reader.translation"))
-        self._comments_label.setText(self._i18n.get("reader.comments"))
-        self._refresh_btn.setText(self._i18n.get("reader.refresh"))
+        rev = self._i18n.revision
+        if rev == self._last_locale_rev:
+            return
+        self._last_locale_rev = rev
+        s = self._i18n.snapshot(self._I18N_KEYS)
+        self._posts_label.setText(s["reader.posts"])
+        self._translation_label.setText(s["reader.translation"])
+        self._comments_label.setText(s["reader.comments"])
+        self._refresh_btn.setText(s["reader.refresh"])
         self._toggle_btn.setText(
-            self._i18n.get("reader.toggle_translation") if self._showing_original
-            else self._i18n.get("reader.toggle_original")
+            s["reader.toggle_translation"] if self._showing_original
+            else s["reader.toggle_original"]
         )
-        self._write_comment_btn.setText(self._i18n.get("reader.write_comment"))
+        self._write_comment_btn.setText(s["reader.write_comment"])
+        if self._anim_active:
+            self._build_anim_frames()
@@ -1,82 +1,110 @@
 """Refine chat widget for iterative translation refinement."""
 
 import logging
+import math
 from typing import Optional
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QLineEdit, QScrollArea, QFrame,
+    QPushButton, QLabel, QLineEdit, QScrollArea, QFrame, QTextEdit, QSizePolicy,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSizeF, QMargins
+from PyQt6.QtGui import QTextCursor
 
 from src.core.i18n_manager import I18nManager
 
 logger = logging.getLogger("reddiscribe")
 
+# Streamed tokens are appended to the bubble at most this often (~60 Hz)
+STREAM_FLUSH_MS = 16
+
+# Bubble styles, set once on RefineChatWidget and matched by object name so
+# Qt parses them a single time instead of per bubble
+_CHAT_QSS = """
+#AiBubble { background-color: #2d2d3d; border-radius: 8px; margin-right: 40px; }
+#UserBubble { background-color: #1a3a5c; border-radius: 8px; margin-left: 40px; }
+#TransBubble {
+    background-color: #1a4a2a; border: 1px solid #2d6b3d;
+    border-radius: 8px; margin-right: 40px;
+}
+#AiBubble QLabel, #UserBubble QLabel { color: #e0e0e0; font-size: 13px; }
+#AiBubble QTextEdit { background: transparent; color: #e0e0e0; font-size: 13px; }
+#TransBubble QLabel { color: #c8e6c9; font-size: 13px; font-style: italic; }
+"""
+
+# Shared by every bubble layout
+_BUBBLE_MARGINS = QMargins(8, 4, 8, 4)
+
 
 class ChatBubble(QFrame):
     """A single chat message bubble."""
 
     def __init__(self, text: str, is_ai: bool, parent=None):
         super().__init__(parent)
-        self._is_ai = is_ai
-        self._setup_ui(text)
+        self._setup_ui(text, is_ai)
 
-    def _setup_ui(self, text: str):
+    def _setup_ui(self, text: str, is_ai: bool):
         layout = QVBoxLayout(self)
-        layout.setContentsMargins(8, 4, 8, 4)
+        layout.setContentsMargins(_BUBBLE_MARGINS)
 
         label = QLabel(text)
+        label.setTextFormat(Qt.TextFormat.PlainText)
         label.setWordWrap(True)
         label.setTextInteractionFlags(
             Qt.TextInteractionFlag.TextSelectableByMouse
         )
 
-        if self._is_ai:
-            self.setStyleSheet(
-                "ChatBubble {"
-                "  background-color: #2d2d3d;"
-                "  border-radius: 8px;"
-                "  margin-right: 40px;"
-                "}"
-            )
-            label.setStyleSheet("color: #e0e0e0; font-size: 13px;")
-        else:
-            self.setStyleSheet(
-                "ChatBubble {"
-                "  background-color: #1a3a5c;"
-                "  border-radius: 8px;"
-                "  margin-left: 40px;"
-                "}"
-            )
-            label.setStyleSheet("color: #e0e0e0; font-size: 13px;")
+        # Styled by _CHAT_QSS on the chat widget
+        self.setObjectName("AiBubble" if is_ai else "UserBubble")
 
         layout.addWidget(label)
 
 
+class StreamingText(QTextEdit):
+    """Read-only text view for a bubble whose text arrives in pieces.
+
+    Appending through a QTextCursor only lays out the new text, unlike
+    QLabel.setText which re-lays out the whole message on every update.
+    The view grows with its document so it sizes like a word-wrapped label.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.document().setDocumentMargin(0)
+        self.document().documentLayout().documentSizeChanged.connect(self._fit_height)
+        self._cursor = QTextCursor(self.document())
+        self._fit_height(self.document().size())
+
+    def append_text(self, text: str):
+        """Insert *text* at the end of the document."""
+        self._cursor.movePosition(QTextCursor.MoveOperation.End)
+        self._cursor.insertText(text)
+
+    def _fit_height(self, size: QSizeF):
+        self.setFixedHeight(max(math.ceil(size.height()), self.fontMetrics().height()))
+
+
 class TranslationBubble(QFrame):
     """A highlighted translation suggestion within chat."""
 
     def __init__(self, translation: str, parent=None):
         super().__init__(parent)
         layout = QVBoxLayout(self)
-        layout.setContentsMargins(8, 4, 8, 4)
+        layout.setContentsMargins(_BUBBLE_MARGINS)
 
         label = QLabel(translation)
+        label.setTextFormat(Qt.TextFormat.PlainText)
         label.setWordWrap(True)
         label.setTextInteractionFlags(
             Qt.TextInteractionFlag.TextSelectableByMouse
         )
 
-        self.setStyleSheet(
-            "TranslationBubble {"
-            "  background-color: #1a4a2a;"
-            "  border: 1px solid #2d6b3d;"
-            "  border-radius: 8px;"
-            "  margin-right: 40px;"
-            "}"
-        )
-        label.setStyleSheet("color: #c8e6c9; font-size: 13px; font-style: italic;")
+        self.setObjectName("TransBubble")  # styled by _CHAT_QSS
 
         layout.addWidget(label)
 
@@ -92,14 +120,31 @@ class RefineChatWidget(QWidget):
     message_sent = pyqtSignal(str)
     translation_suggested = pyqtSignal(str)
 
+    # Labels refreshed by retranslate_ui()
+    _I18N_KEYS = (
+        "writer.refine_header",
+        "writer.refine_placeholder",
+        "writer.refine_send",
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._i18n = I18nManager()
+        self._last_locale_rev = -1  # I18nManager.revision at last retranslate_ui()
         self._init_ui()
-        self._streaming_label: Optional[QLabel] = None
+        self._streaming_label: Optional[StreamingText] = None
         self._streaming_bubble: Optional[ChatBubble] = None
 
+        # Streamed tokens are buffered and inserted once per flush via StreamingText.append_text()
+        self._stream_buf: list[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(STREAM_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_stream)
+        self._scroll_pending: bool = False  # a _do_scroll is already queued
+
     def _init_ui(self):
+        self.setStyleSheet(_CHAT_QSS)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(4, 0, 4, 4)
 
@@ -178,12 +223,24 @@ class RefineChatWidget(QWidget):
         self.translation_suggested.emit(translation)
 
     def clear_chat(self):
-        """Remove all messages from the chat."""
-        while self._chat_layout.count() > 1:  # Keep the stretch
-            item = self._chat_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+        """Remove all messages from the chat.
+
+        Repaints are held until every bubble is gone, so the container is
+        laid out once instead of once per removed bubble.
+        """
+        self._chat_container.setUpdatesEnabled(False)
+        try:
+            # Take from the back so the layout never shifts the remaining
+            # items; the trailing stretch stays
+            for i in range(self._chat_layout.count() - 2, -1, -1):
+                item = self._chat_layout.takeAt(i)
+                widget = item.widget()
+                if widget:
+                    widget.setParent(None)
+                    widget.deleteLater()
+        finally:
+            self._chat_container.setUpdatesEnabled(True)
+        self._chat_container.updateGeometry()
 
     def set_input_enabled(self, enabled: bool):
         """Enable or disable the input area."""
@@ -193,28 +250,48 @@ class RefineChatWidget(QWidget):
             self._input.setFocus()
 
     def _scroll_to_bottom(self):
-        """Scroll chat area to the bottom."""
-        from PyQt6.QtCore import QTimer
-        QTimer.singleShot(0, lambda: self._scroll_area.verticalScrollBar().setValue(
-            self._scroll_area.verticalScrollBar().maximum()
-        ))
+        """Scroll chat area to the bottom (once per event-loop pass)."""
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
+        QTimer.singleShot(0, self._do_scroll)
+
+    def _do_scroll(self):
+        """Deferred part of _scroll_to_bottom, after the layout has updated."""
+        self._scroll_pending = False
+        bar = self._scroll_area.verticalScrollBar()
+        bar.setValue(bar.maximum())
 
     def start_streaming_ai_message(self):
         """Start a new AI message bubble for streaming tokens."""
+        self._flush_stream()
         idx = self._chat_layout.count() - 1
         bubble = ChatBubble("", is_ai=True)
         self._chat_layout.insertWidget(idx, bubble)
         self._streaming_bubble = bubble
-        # Get the QLabel from the bubble's layout
-        self._streaming_label = bubble.layout().itemAt(0).widget()
+        # Swap the bubble's QLabel for a view that appends without re-layout
+        label = bubble.layout().itemAt(0).widget()
+        self._streaming_label = StreamingText()
+        bubble.layout().replaceWidget(label, self._streaming_label)
+        label.deleteLater()
         self._scroll_to_bottom()
 
     def append_to_streaming_message(self, token: str):
-        """Append a token to the current streaming AI message."""
+        """Buffer a token for the current streaming AI message."""
+        if self._streaming_label:
+            self._stream_buf.append(token)
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
+
+    def _flush_stream(self):
+        """Append all buffered tokens to the streaming bubble at once."""
+        self._flush_timer.stop()
+        if not self._stream_buf:
+            return
         if self._streaming_label:
-            current = self._streaming_label.text()
-            self._streaming_label.setText(current + token)
+            self._streaming_label.append_text("".join(self._stream_buf))
             self._scroll_to_bottom()
+        self._stream_buf.clear()
 
     def finish_streaming_message(self, final_text: str = None):
         """Finalize the streaming message.
@@ -223,9 +300,10 @@ class RefineChatWidget(QWidget):
             final_text: If provided, replace bubble text (e.g. comment without tags).
                         If empty string, remove the bubble entirely.
         """
+        self._flush_stream()
         if self._streaming_label and final_text is not None:
             if final_text:
-                self._streaming_label.setText(final_text)
+                self._streaming_label.setPlainText(final_text)
             elif self._streaming_bubble:
                 # Empty comment - remove the bubble entirely
                 self._streaming_bubble.deleteLater()
@@ -234,6 +312,11 @@ class RefineChatWidget(QWidget):
 
     def retranslate_ui(self):
         """Update labels for locale change."""
-        self._header.setText(self._i18n.get("writer.refine_header"))
-        self._input.setPlaceholderText(self._i18n.get("writer.refine_placeholder"))
-        self._send_btn.setText(self._i18n.get("writer.refine_send"))
+        rev = self._i18n.revision
+        if rev == self._last_locale_rev:
+            return
+        self._last_locale_rev = rev
+        s = self._i18n.snapshot(self._I18N_KEYS)
+        self._header.setText(s["writer.refine_header"])
+        self._input.setPlaceholderText(s["writer.refine_placeholder"])
+        self._send_btn.setText(s["writer.refine_send"])
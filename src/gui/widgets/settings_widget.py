@@ -6,31 +6,53 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout, QGroupBox,
     QPushButton, QComboBox, QSpinBox, QCheckBox,
     QLineEdit, QLabel, QTextEdit, QDoubleSpinBox,
-    QScrollArea, QListWidget, QHBoxLayout,
+    QScrollArea, QListView, QHBoxLayout, QInputDialog, QMessageBox,
 )
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, Qt, QSignalBlocker
 
 from src.core.config_manager import ConfigManager
 from src.core.i18n_manager import I18nManager
 from src.adapters.ollama_adapter import format_model_size
+from src.gui.workers import ModelFetchWorker, SubredditValidationWorker
+from src.gui.widgets.subreddit_list_model import SubredditListModel
 
 logger = logging.getLogger("reddiscribe")
 
+_HEADER_QSS = "font-size: 16px; font-weight: bold;"
+
+
+def _combo_model_name(combo: QComboBox) -> str:
+    """Extract model name from combo box, respecting user edits.
+
+    If the user cleared the text, returns empty string even if
+    currentData() still holds the previous selection's userData.
+    """
+    text = combo.currentText().strip()
+    if not text:
+        return ""
+    return combo.currentData() or text
+
 
 class SettingsWidget(QWidget):
     """Settings tab with grouped config fields and batch save."""
 
     # Signal emitted when locale changes (MainWindow listens to retranslate)
     locale_changed = pyqtSignal(str)  # new locale string
-    settings_saved = pyqtSignal()
+    settings_saved = pyqtSignal(object)  # set of config keys that changed
 
-    def __init__(self, config: ConfigManager, ollama_adapter=None, reddit_adapter=None, parent=None):
+    def __init__(self, config: ConfigManager, ollama_adapter=None, reddit_adapter=None,
+                 subreddit_model: SubredditListModel = None, parent=None):
         super().__init__(parent)
         self._config = config
+        # Shared with TopBarWidget when MainWindow passes one in; like the
+        # top bar, add/remove saves the list immediately rather than on Save
+        self._subreddit_model = subreddit_model or SubredditListModel.from_config(config, self)
         self._i18n = I18nManager()
+        self._last_locale_rev = -1  # I18nManager.revision at last retranslate_ui()
         self._ollama_adapter = ollama_adapter
         self._reddit_adapter = reddit_adapter
         self._model_fetch_worker = None
+        self._models_signature: tuple = ()  # (name, size) pairs last filled into the combos
         self._sub_validation_worker = None
         self._init_ui()
         self._load_values()
@@ -46,7 +68,7 @@ class SettingsWidget(QWidget):
         layout = QVBoxLayout(container)
 
         self._header = QLabel(self._i18n.get("settings.header"))
-        self._header.setStyleSheet("font-size: 16px; font-weight: bold;")
+        self._header.setStyleSheet(_HEADER_QSS)
         layout.addWidget(self._header)
 
         # === Application group ===
@@ -151,7 +173,9 @@ class SettingsWidget(QWidget):
 
         # Subreddit list management
         self._subreddit_list_label = QLabel(self._i18n.get("settings.subreddit_list_label"))
-        self._subreddit_list = QListWidget()
+        self._subreddit_list = QListView()
+        self._subreddit_list.setModel(self._subreddit_model)
+        self._subreddit_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
         self._subreddit_list.setMaximumHeight(120)
         reddit_form.addRow(self._subreddit_list_label, self._subreddit_list)
 
@@ -200,34 +224,82 @@ class SettingsWidget(QWidget):
         scroll.setWidget(container)
         outer_layout.addWidget(scroll)
 
+        # (setter, key) for every static label; retranslate_ui() replays them.
+        # The refresh button is handled separately: it shows status text too.
+        self._i18n_bindings = [
+            (self._header.setText, "settings.header"),
+            (self._app_group.setTitle, "settings.app_group"),
+            (self._lang_label.setText, "settings.lang_label"),
+            (self._theme_label.setText, "settings.theme_label"),
+            (self._translation_group.setTitle, "settings.translation_group"),
+            (self._source_lang_label.setText, "settings.source_lang_label"),
+            (self._target_lang_label.setText, "settings.target_lang_label"),
+            (self._reader_lang_label.setText, "settings.reader_lang_label"),
+            (self._llm_group.setTitle, "settings.llm_group"),
+            (self._logic_label.setText, "settings.logic_label"),
+            (self._persona_label.setText, "settings.persona_label"),
+            (self._host_label.setText, "settings.host_label"),
+            (self._timeout_label.setText, "settings.timeout_label"),
+            (self._persona_group.setTitle, "settings.persona_group"),
+            (self._persona_temp_label.setText, "settings.persona_temp_label"),
+            (self._persona_prompt_label.setText, "settings.persona_prompt_label"),
+            (self._reddit_group.setTitle, "settings.reddit_group"),
+            (self._subreddit_list_label.setText, "settings.subreddit_list_label"),
+            (self._add_sub_btn.setText, "settings.add_subreddit_btn"),
+            (self._remove_sub_btn.setText, "settings.remove_subreddit_btn"),
+            (self._interval_label.setText, "settings.interval_label"),
+            (self._mock_label.setText, "settings.mock_label"),
+            (self._advanced_group.setTitle, "settings.advanced_group"),
+            (self._log_label.setText, "settings.log_level_label"),
+            (self._save_btn.setText, "settings.save_btn"),
+        ]
+        self._i18n_keys = tuple(key for _setter, key in self._i18n_bindings) + (
+            "settings.refresh_models_btn",
+        )
+
     def _load_values(self):
         """Load current config values into widgets."""
-        self._lang_combo.setCurrentText(self._config.get("app.locale", "ko_KR"))
-        self._theme_combo.setCurrentText(self._config.get("app.theme", "dark"))
+        (
+            locale, theme, source_lang, target_lang, reader_lang,
+            logic_name, persona_name, host, timeout, persona_temp, persona_prompt,
+            interval, mock_mode, log_level,
+        ) = self._config.get_many([
+            ("app.locale", "ko_KR"),
+            ("app.theme", "dark"),
+            ("translation.source_lang", "Korean"),
+            ("translation.target_lang", "English"),
+            ("translation.reader_lang", "Korean"),
+            ("llm.models.logic.name", ""),
+            ("llm.models.persona.name", ""),
+            ("llm.providers.ollama.host", "http://localhost:11434"),
+            ("llm.providers.ollama.timeout", 120),
+            ("llm.models.persona.temperature", 0.7),
+            ("llm.models.persona.prompt", ""),
+            ("reddit.request_interval_sec", 6),
+            ("reddit.mock_mode", False),
+            ("app.log_level", "INFO"),
+        ])
+
+        self._lang_combo.setCurrentText(locale)
+        self._theme_combo.setCurrentText(theme)
         # Translation settings
-        self._source_lang_combo.setCurrentText(self._config.get("translation.source_lang", "Korean"))
-        self._target_lang_combo.setCurrentText(self._config.get("translation.target_lang", "English"))
-        self._reader_lang_combo.setCurrentText(self._config.get("translation.reader_lang", "Korean"))
+        self._source_lang_combo.setCurrentText(source_lang)
+        self._target_lang_combo.setCurrentText(target_lang)
+        self._reader_lang_combo.setCurrentText(reader_lang)
         # LLM settings
-        self._logic_combo.setCurrentText(self._config.get("llm.models.logic.name", ""))
-        self._persona_combo.setCurrentText(self._config.get("llm.models.persona.name", ""))
-        self._host_input.setText(self._config.get("llm.providers.ollama.host", "http://localhost:11434"))
-        self._timeout_spin.setValue(self._config.get("llm.providers.ollama.timeout", 120))
-        self._persona_temp_spin.setValue(self._config.get("llm.models.persona.temperature", 0.7))
-        self._persona_prompt_input.setPlainText(self._config.get("llm.models.persona.prompt", ""))
-        # Load subreddit list
-        subreddits = self._config.get("reddit.subreddits", [])
-        self._subreddit_list.clear()
-        self._subreddit_list.addItems(subreddits)
-        self._interval_spin.setValue(self._config.get("reddit.request_interval_sec", 6))
-        self._mock_check.setChecked(self._config.get("reddit.mock_mode", False))
-        self._log_combo.setCurrentText(self._config.get("app.log_level", "INFO"))
+        self._logic_combo.setCurrentText(logic_name)
+        self._persona_combo.setCurrentText(persona_name)
+        self._host_input.setText(host)
+        self._timeout_spin.setValue(timeout)
+        self._persona_temp_spin.setValue(persona_temp)
+        self._persona_prompt_input.setPlainText(persona_prompt)
+        self._interval_spin.setValue(interval)
+        self._mock_check.setChecked(mock_mode)
+        self._log_combo.setCurrentText(log_level)
         self._fetch_models()
 
     def _on_save(self):
         """Collect changes and batch update config."""
-        old_locale = self._config.get("app.locale", "ko_KR")
-
         changes = {
             "app.locale": self._lang_combo.currentText(),
             "app.log_level": self._log_combo.currentText(),
@@ -236,77 +308,41 @@ class SettingsWidget(QWidget):
             "translation.target_lang": self._target_lang_combo.currentText(),
             "translation.reader_lang": self._reader_lang_combo.currentText(),
             # LLM settings
-            "llm.models.logic.name": self._get_combo_model_name(self._logic_combo),
-            "llm.models.persona.name": self._get_combo_model_name(self._persona_combo),
+            "llm.models.logic.name": _combo_model_name(self._logic_combo),
+            "llm.models.persona.name": _combo_model_name(self._persona_combo),
             "llm.models.persona.temperature": self._persona_temp_spin.value(),
             "llm.models.persona.prompt": self._persona_prompt_input.toPlainText(),
             "llm.providers.ollama.host": self._host_input.text(),
             "llm.providers.ollama.timeout": self._timeout_spin.value(),
-            "reddit.subreddits": [self._subreddit_list.item(i).text() for i in range(self._subreddit_list.count())],
             "reddit.request_interval_sec": self._interval_spin.value(),
             "reddit.mock_mode": self._mock_check.isChecked(),
         }
 
-        self._config.update(changes)
-        self.settings_saved.emit()
+        changed = self._config.update(changes)
+        self.settings_saved.emit(changed)
 
-        new_locale = self._config.get("app.locale", "ko_KR")
-        if new_locale != old_locale:
-            self.locale_changed.emit(new_locale)
+        if "app.locale" in changed:
+            self.locale_changed.emit(changes["app.locale"])
 
         logger.info("Settings saved")
 
-    @staticmethod
-    def _get_combo_model_name(combo) -> str:
-        """Extract model name from combo box, respecting user edits.
-
-        If the user cleared the text, returns empty string even if
-        currentData() still holds the previous selection's userData.
-        """
-        text = combo.currentText().strip()
-        if not text:
-            return ""
-        data = combo.currentData()
-        return data if data else text
-
     def retranslate_ui(self):
         """Update all labels for locale change."""
-        self._header.setText(self._i18n.get("settings.header"))
-        self._app_group.setTitle(self._i18n.get("settings.app_group"))
-        self._lang_label.setText(self._i18n.get("settings.lang_label"))
-        self._theme_label.setText(self._i18n.get("settings.theme_label"))
-        # Translation group
-        self._translation_group.setTitle(self._i18n.get("settings.translation_group"))
-        self._source_lang_label.setText(self._i18n.get("settings.source_lang_label"))
-        self._target_lang_label.setText(self._i18n.get("settings.target_lang_label"))
-        self._reader_lang_label.setText(self._i18n.get("settings.reader_lang_label"))
-        self._llm_group.setTitle(self._i18n.get("settings.llm_group"))
-        self._logic_label.setText(self._i18n.get("settings.logic_label"))
-        self._persona_label.setText(self._i18n.get("settings.persona_label"))
-        self._host_label.setText(self._i18n.get("settings.host_label"))
-        self._timeout_label.setText(self._i18n.get("settings.timeout_label"))
-        self._persona_group.setTitle(self._i18n.get("settings.persona_group"))
-        self._persona_temp_label.setText(self._i18n.get("settings.persona_temp_label"))
-        self._persona_prompt_label.setText(self._i18n.get("settings.persona_prompt_label"))
-        self._reddit_group.setTitle(self._i18n.get("settings.reddit_group"))
-        self._subreddit_list_label.setText(self._i18n.get("settings.subreddit_list_label"))
-        self._add_sub_btn.setText(self._i18n.get("settings.add_subreddit_btn"))
-        self._remove_sub_btn.setText(self._i18n.get("settings.remove_subreddit_btn"))
-        self._interval_label.setText(self._i18n.get("settings.interval_label"))
-        self._mock_label.setText(self._i18n.get("settings.mock_label"))
-        self._advanced_group.setTitle(self._i18n.get("settings.advanced_group"))
-        self._log_label.setText(self._i18n.get("settings.log_level_label"))
+        rev = self._i18n.revision
+        if rev == self._last_locale_rev:
+            return
+        self._last_locale_rev = rev
+        s = self._i18n.snapshot(self._i18n_keys)
+        for setter, key in self._i18n_bindings:
+            setter(s[key])
         if self._refresh_models_btn.isEnabled():
-            self._refresh_models_btn.setText(self._i18n.get("settings.refresh_models_btn"))
-        self._save_btn.setText(self._i18n.get("settings.save_btn"))
+            self._refresh_models_btn.setText(s["settings.refresh_models_btn"])
 
     def _fetch_models(self):
         """Fetch available models from Ollama in background."""
         if self._ollama_adapter is None:
             return
 
-        from src.gui.workers import ModelFetchWorker
-
         # Prevent concurrent fetches
         if self._model_fetch_worker is not None and self._model_fetch_worker.isRunning():
             return
@@ -331,25 +367,39 @@ class SettingsWidget(QWidget):
         self._refresh_models_btn.setText(self._i18n.get("settings.refresh_models_btn"))
 
         sorted_models = sorted(models, key=lambda m: m.get("name", ""))
+        signature = tuple((m.get("name", ""), m.get("size", 0)) for m in sorted_models)
+        if signature == self._models_signature:
+            return  # same list as last time; keep combos (and user edits) as they are
+        self._models_signature = signature
+        names = []
+        displays = []
+        for m in sorted_models:
+            name = m.get("name", "")
+            size_str = format_model_size(m.get("size", 0))
+            names.append(name)
+            displays.append(f"{name} ({size_str})" if size_str else name)
 
         for combo in (self._logic_combo, self._persona_combo):
             current_text = combo.currentText()
             # Check if current text has size suffix and extract name
             current_data = combo.currentData()
             current_name = current_data if current_data else current_text
-            combo.clear()
-            for m in sorted_models:
-                name = m.get("name", "")
-                size = m.get("size", 0)
-                size_str = format_model_size(size)
-                display = f"{name} ({size_str})" if size_str else name
-                combo.addItem(display, userData=name)
-            # Restore selection by matching stored name
-            idx = combo.findData(current_name)
-            if idx >= 0:
-                combo.setCurrentIndex(idx)
-            elif current_name:
-                combo.setCurrentText(current_name)
+            # Refill silently and in one pass: no per-item signals or repaints
+            with QSignalBlocker(combo):
+                combo.setUpdatesEnabled(False)
+                try:
+                    combo.clear()
+                    combo.addItems(displays)
+                    for i, name in enumerate(names):
+                        combo.setItemData(i, name)
+                    # Restore selection by matching stored name
+                    idx = combo.findData(current_name)
+                    if idx >= 0:
+                        combo.setCurrentIndex(idx)
+                    elif current_name:
+                        combo.setCurrentText(current_name)
+                finally:
+                    combo.setUpdatesEnabled(True)
 
     def _on_models_error(self, error_msg: str):
         """Handle model fetch error."""
@@ -363,7 +413,6 @@ class SettingsWidget(QWidget):
 
     def _on_add_subreddit(self):
         """Add a subreddit to the list with optional API validation."""
-        from PyQt6.QtWidgets import QInputDialog
         name, ok = QInputDialog.getText(
             self,
             self._i18n.get("topbar.add_subreddit"),
@@ -372,22 +421,17 @@ class SettingsWidget(QWidget):
         if ok and name.strip():
             name = name.strip().lower().removeprefix("r/")
             # Check for duplicates
-            existing = [self._subreddit_list.item(i).text() for i in range(self._subreddit_list.count())]
-            if name in existing:
-                from PyQt6.QtWidgets import QMessageBox
+            if name in self._subreddit_model:
                 QMessageBox.information(self, self._i18n.get("topbar.add_subreddit"), self._i18n.get("topbar.duplicate"))
                 return
             # Validate via API if adapter available
             if self._reddit_adapter is not None:
                 self._start_sub_validation(name)
             else:
-                self._subreddit_list.addItem(name)
+                self._add_subreddit_item(name)
 
     def _start_sub_validation(self, name: str):
         """Validate subreddit via API before adding."""
-        from src.gui.workers import SubredditValidationWorker
-        from PyQt6.QtWidgets import QMessageBox
-
         if self._sub_validation_worker is not None:
             if self._sub_validation_worker.isRunning():
                 return
@@ -407,11 +451,15 @@ class SettingsWidget(QWidget):
         """Handle successful subreddit validation."""
         self._add_sub_btn.setEnabled(True)
         self._add_sub_btn.setText(self._i18n.get("settings.add_subreddit_btn"))
-        self._subreddit_list.addItem(name)
+        self._add_subreddit_item(name)
+
+    def _add_subreddit_item(self, name: str):
+        """Append a subreddit to the shared list model and save it."""
+        self._subreddit_model.append(name)
+        self._subreddit_model.save(self._config)
 
     def _on_sub_validation_error(self, name: str, error_key: str):
         """Handle failed subreddit validation."""
-        from PyQt6.QtWidgets import QMessageBox
         self._add_sub_btn.setEnabled(True)
         self._add_sub_btn.setText(self._i18n.get("settings.add_subreddit_btn"))
         QMessageBox.warning(
@@ -422,6 +470,7 @@ class SettingsWidget(QWidget):
 
     def _on_remove_subreddit(self):
         """Remove the selected subreddit from the list."""
-        current = self._subreddit_list.currentRow()
-        if current >= 0:
-            self._subreddit_list.takeItem(current)
+        index = self._subreddit_list.currentIndex()
+        if index.isValid():
+            self._subreddit_model.remove_row(index.row())
+            self._subreddit_model.save(self._config)
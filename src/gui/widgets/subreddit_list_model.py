@@ -0,0 +1,64 @@
+"""Subreddit list model shared by the top bar and the settings tab."""
+
+from typing import Iterable
+
+from PyQt6.QtCore import QStringListModel
+
+from src.core.config_manager import ConfigManager
+
+# Used when the config has no "reddit.subreddits" entry
+DEFAULT_SUBREDDITS = ["AI_Application", "AiBuilders", "AIDevHub", "ClaudeCode"]
+
+
+class SubredditListModel(QStringListModel):
+    """Ordered subreddit names with an O(1) membership check.
+
+    MainWindow creates one instance and hands it to both the top bar combo
+    and the settings list, so an add or remove in either view reaches the
+    other through Qt's model signals instead of a reload from config.
+    Both views call save() right after each add or remove, so the list on
+    disk always matches what they show. Names should only change through
+    append()/remove_row()/set_names(), which keep the lookup set in sync.
+    """
+
+    def __init__(self, names: Iterable[str] = (), parent=None):
+        names = list(names)
+        super().__init__(names, parent)
+        self._name_set: set[str] = set(names)
+
+    @classmethod
+    def from_config(cls, config: ConfigManager, parent=None) -> "SubredditListModel":
+        """Build the model from the saved "reddit.subreddits" list."""
+        return cls(config.get("reddit.subreddits", DEFAULT_SUBREDDITS), parent)
+
+    def save(self, config: ConfigManager):
+        """Write the names to "reddit.subreddits" and save the config file."""
+        config.set("reddit.subreddits", self.names())
+        config.save()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._name_set
+
+    def names(self) -> list[str]:
+        """Return the names in row order."""
+        return self.stringList()
+
+    def set_names(self, names: Iterable[str]):
+        """Replace all rows in one model reset."""
+        names = list(names)
+        self.setStringList(names)
+        self._name_set = set(names)
+
+    def append(self, name: str) -> int:
+        """Add *name* as the last row and return that row."""
+        row = self.rowCount()
+        self.insertRows(row, 1)
+        self.setData(self.index(row), name)
+        self._name_set.add(name)
+        return row
+
+    def remove_row(self, row: int):
+        """Remove the name at *row* (no-op if out of range)."""
+        if 0 <= row < self.rowCount():
+            self._name_set.discard(self.index(row).data())
+            self.removeRows(row, 1)
@@ -1,47 +1,66 @@
 """Global top bar with subreddit selector and activity indicator."""
 
 import logging
+import time
 
 from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QPushButton, QComboBox,
     QLabel, QInputDialog, QMessageBox,
 )
-from PyQt6.QtCore import pyqtSignal, Qt, QTimer
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer, QSignalBlocker
 
 from src.core.config_manager import ConfigManager
 from src.core.i18n_manager import I18nManager
+from src.gui.workers import SubredditValidationWorker
+from src.gui.widgets.subreddit_list_model import SubredditListModel
 
 logger = logging.getLogger("reddiscribe")
 
+# Activity indicator refresh interval (dots and elapsed seconds)
+ACTIVITY_TICK_MS = 500
+_ACTIVITY_DOTS = ("", ".", "..", "...")
+
+# Whole top bar styled by one sheet, parsed once per instance
+_TOPBAR_QSS = """
+TopBarWidget { background-color: #1e1e2e; border-bottom: 1px solid #3d3d3d; }
+QLabel#activityLabel { color: #4fc3f7; font-size: 12px; }
+"""
+
 
 class TopBarWidget(QWidget):
     """Global top bar with subreddit dropdown and activity indicator."""
 
     subreddit_changed = pyqtSignal(str)
-    subreddit_list_changed = pyqtSignal(list)
 
-    def __init__(self, config: ConfigManager, reddit_adapter=None, parent=None):
+    def __init__(self, config: ConfigManager, reddit_adapter=None,
+                 subreddit_model: SubredditListModel = None, parent=None):
         super().__init__(parent)
         self._config = config
+        # Shared with SettingsWidget when MainWindow passes one in
+        self._subreddit_model = subreddit_model or SubredditListModel.from_config(config, self)
         self._i18n = I18nManager()
+        self._last_locale_rev = -1  # I18nManager.revision at last retranslate_ui()
         self._reddit_adapter = reddit_adapter
         self._validation_worker = None
-        self._active_tasks = {}  # {task_name: elapsed_seconds}
+        self._active_tasks = {}  # {task_name: time.monotonic() at start}
         self._init_ui()
-        self._load_subreddits()
 
     def _init_ui(self):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(8, 4, 8, 4)
         self.setFixedHeight(36)
-        self.setStyleSheet(
-            "TopBarWidget { background-color: #1e1e2e; border-bottom: 1px solid #3d3d3d; }"
-        )
+        self.setStyleSheet(_TOPBAR_QSS)
 
-        # Subreddit dropdown
+        # Subreddit dropdown; starts on the "---" placeholder (no auto-fetch).
+        # textActivated only fires on user picks, not on model edits.
         self._sub_combo = QComboBox()
         self._sub_combo.setMinimumWidth(150)
-        self._sub_combo.currentTextChanged.connect(self._on_subreddit_changed)
+        self._sub_combo.setPlaceholderText("---")
+        with QSignalBlocker(self._sub_combo):
+            self._sub_combo.setModel(self._subreddit_model)
+            self._sub_combo.setCurrentIndex(-1)
+        self._sub_combo.textActivated.connect(self._on_subreddit_changed)
+        self._subreddit_model.rowsAboutToBeRemoved.connect(self._on_subreddit_rows_removed)
         layout.addWidget(self._sub_combo)
 
         # Add button
@@ -55,46 +74,30 @@ class TopBarWidget(QWidget):
 
         # Activity indicator (always present, just empty when idle)
         self._activity_label = QLabel("")
-        self._activity_label.setStyleSheet(
-            "QLabel { color: #4fc3f7; font-size: 12px; }"
-        )
+        self._activity_label.setObjectName("activityLabel")
         self._activity_label.setAlignment(
             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
         )
         layout.addWidget(self._activity_label)
 
-        # Activity animation timer
+        # One timer drives both the dots and the elapsed counters
         self._activity_timer = QTimer(self)
-        self._activity_timer.setInterval(500)
+        self._activity_timer.setInterval(ACTIVITY_TICK_MS)
         self._activity_timer.timeout.connect(self._update_activity_animation)
         self._activity_dot_count = 0
-
-        # Elapsed time timer
-        self._elapsed_timer = QTimer(self)
-        self._elapsed_timer.setInterval(1000)
-        self._elapsed_timer.timeout.connect(self._update_elapsed_time)
-
-    def _load_subreddits(self, emit_change: bool = True):
-        subs = self._config.get(
-            "reddit.subreddits", ["AI_Application", "AiBuilders", "AIDevHub", "ClaudeCode"]
-        )
-        self._sub_combo.blockSignals(True)
-        self._sub_combo.clear()
-        self._sub_combo.addItem("---")  # placeholder: no auto-fetch
-        for sub in subs:
-            self._sub_combo.addItem(sub)
-        self._sub_combo.blockSignals(False)
-
-    def _save_subreddits(self):
-        subs = [self._sub_combo.itemText(i) for i in range(self._sub_combo.count()) if self._sub_combo.itemText(i) != "---"]
-        self._config.set("reddit.subreddits", subs)
-        self._config.save()
-        self.subreddit_list_changed.emit(subs)
+        self._activity_text = ""  # last text set on _activity_label
+        self._elapsed_fmt = self._i18n.get_cached("status.elapsed")  # per locale
 
     def _on_subreddit_changed(self, text: str):
-        if text and text != "---":
+        if text:
             self.subreddit_changed.emit(text)
 
+    def _on_subreddit_rows_removed(self, _parent, first: int, last: int):
+        # Settings removed the shown subreddit: fall back to the placeholder
+        # rather than letting the combo silently show a neighbour
+        if first <= self._sub_combo.currentIndex() <= last:
+            self._sub_combo.setCurrentIndex(-1)
+
     def _on_add_subreddit(self):
         text, ok = QInputDialog.getText(
             self,
@@ -107,14 +110,13 @@ class TopBarWidget(QWidget):
         name = text.strip().lower().removeprefix("r/")
 
         # Check duplicates
-        for i in range(self._sub_combo.count()):
-            if self._sub_combo.itemText(i) == name:
-                QMessageBox.information(
-                    self,
-                    self._i18n.get("topbar.add_subreddit"),
-                    self._i18n.get("topbar.duplicate"),
-                )
-                return
+        if name in self._subreddit_model:
+            QMessageBox.information(
+                self,
+                self._i18n.get("topbar.add_subreddit"),
+                self._i18n.get("topbar.duplicate"),
+            )
+            return
 
         # Validate via API if adapter available
         if self._reddit_adapter is not None:
@@ -124,8 +126,6 @@ class TopBarWidget(QWidget):
             self._add_subreddit_to_combo(name)
 
     def _start_validation(self, name: str):
-        from src.gui.workers import SubredditValidationWorker
-
         # Clean up previous worker
         if self._validation_worker is not None:
             if self._validation_worker.isRunning():
@@ -157,55 +157,74 @@ class TopBarWidget(QWidget):
         )
 
     def _add_subreddit_to_combo(self, name: str):
-        self._sub_combo.addItem(name)
-        self._sub_combo.setCurrentText(name)
-        self._save_subreddits()
+        row = self._subreddit_model.append(name)
+        self._sub_combo.setCurrentIndex(row)
+        self._on_subreddit_changed(name)
+        self._subreddit_model.save(self._config)
 
     # --- Activity indicator ---
 
     def on_activity_started(self, task_name: str):
         """Register an active task for the activity indicator."""
-        self._active_tasks[task_name] = 0
+        self._active_tasks[task_name] = time.monotonic()
         self._activity_dot_count = 0
-        if not self._activity_timer.isActive():
+        if not self._activity_timer.isActive() and self.isVisible():
             self._activity_timer.start()
-            self._elapsed_timer.start()
 
     def on_activity_finished(self, task_name: str):
         """Remove a finished task from the activity indicator."""
         self._active_tasks.pop(task_name, None)
         if not self._active_tasks:
             self._activity_timer.stop()
-            self._elapsed_timer.stop()
+            self._activity_text = ""
             self._activity_label.setText("")
 
+    def _format_elapsed(self, seconds: int) -> str:
+        """Format the cached "status.elapsed" template; never raises (like I18nManager.get)."""
+        try:
+            return self._elapsed_fmt.format(seconds=seconds)
+        except (KeyError, IndexError, ValueError) as e:
+            logger.warning(f"Failed to format i18n string for key 'status.elapsed': {e}")
+            # Escape the broken template so later ticks show it verbatim without retrying
+            self._elapsed_fmt = self._elapsed_fmt.replace("{", "{{").replace("}", "}}")
+            return self._elapsed_fmt.format()
+
     def _update_activity_animation(self):
         if not self._active_tasks:
             return
         self._activity_dot_count = (self._activity_dot_count + 1) % 4
-        dots = "." * self._activity_dot_count
-        parts = []
-        for name, secs in self._active_tasks.items():
-            elapsed_text = self._i18n.get("status.elapsed", seconds=str(secs))
-            parts.append(f"{name} {elapsed_text}")
-        self._activity_label.setText(f"{' | '.join(parts)}{dots}")
+        dots = _ACTIVITY_DOTS[self._activity_dot_count]
+        elapsed = self._format_elapsed
+        now = time.monotonic()
+        if len(self._active_tasks) == 1:
+            (name, started), = self._active_tasks.items()
+            text = f"{name} {elapsed(int(now - started))}{dots}"
+        else:
+            text = " | ".join(
+                f"{name} {elapsed(int(now - started))}"
+                for name, started in self._active_tasks.items()
+            ) + dots
+        if text != self._activity_text:
+            self._activity_text = text
+            self._activity_label.setText(text)
+
+    def showEvent(self, event):
+        # Elapsed times come from start timestamps, so pausing loses nothing
+        super().showEvent(event)
+        if self._active_tasks and not self._activity_timer.isActive():
+            self._activity_timer.start()
 
-    def _update_elapsed_time(self):
-        for name in self._active_tasks:
-            self._active_tasks[name] += 1
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._activity_timer.stop()
 
     # --- Public API ---
 
-    def reload_subreddits(self):
-        """Reload subreddit list from config (for settings sync)."""
-        current = self._sub_combo.currentText()
-        self._load_subreddits(emit_change=False)
-        idx = self._sub_combo.findText(current)
-        if idx >= 0:
-            self._sub_combo.blockSignals(True)
-            self._sub_combo.setCurrentIndex(idx)
-            self._sub_combo.blockSignals(False)
-
     def retranslate_ui(self):
         """Update all labels for locale change."""
-        self._add_btn.setToolTip(self._i18n.get("topbar.add_subreddit"))
+        rev = self._i18n.revision
+        if rev == self._last_locale_rev:
+            return
+        self._last_locale_rev = rev
+        self._add_btn.setToolTip(self._i18n.get_cached("topbar.add_subreddit"))
+        self._elapsed_fmt = self._i18n.get_cached("status.elapsed")
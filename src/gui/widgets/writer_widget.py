@@ -1,16 +1,17 @@
 """Writer widget for Korean -> English translation with Reddit tone polishing."""
 
 import logging
+from collections import deque
 from typing import Optional
 from urllib.parse import quote_plus
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QTextEdit, QCheckBox,
+    QPushButton, QLabel, QTextEdit, QPlainTextEdit, QCheckBox,
     QApplication, QMessageBox, QLineEdit,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QUrl
-from PyQt6.QtGui import QDesktopServices
+from PyQt6.QtCore import Qt, pyqtSignal, QThreadPool, QTimer, QUrl
+from PyQt6.QtGui import QDesktopServices, QTextCursor
 
 from src.core.i18n_manager import I18nManager
 from src.core.types import WriterContext
@@ -21,6 +22,21 @@ from src.services.writer_service import WriterService, parse_refine_response
 
 logger = logging.getLogger("reddiscribe")
 
+# Styles for the writer's named child widgets, parsed once on the tab
+_WRITER_QSS = """
+QLabel#writerContextInfo { color: #e0e0e0; font-size: 13px; font-weight: bold; }
+QLabel#writerContextDetail { color: #aaaacc; font-size: 12px; }
+QPushButton#writerViewContent { background-color: #2d5a8f; color: white;
+    border: none; border-radius: 4px; padding: 4px 8px; font-size: 12px; }
+QPushButton#writerViewContent:hover { background-color: #3d6a9f; }
+QLabel#writerHeader { font-size: 16px; font-weight: bold; }
+QLabel#writerDraftLabel, QLabel#writerFinalLabel { font-weight: bold; }
+QPushButton#writerSubmit { background-color: #2d6b3d; color: white;
+    border: none; border-radius: 4px; padding: 6px 16px; font-weight: bold; }
+QPushButton#writerSubmit:hover { background-color: #3d8b4d; }
+QPushButton#writerSubmit:disabled { background-color: #444444; color: #888888; }
+"""
+
 
 class WriterWidget(QWidget):
     """Writer tab - 2-stage translation pipeline UI."""
@@ -29,22 +45,70 @@ class WriterWidget(QWidget):
     activity_finished = pyqtSignal(str)     # task completed
     navigate_to_settings = pyqtSignal()
 
+    # Fixed strings resolved by _refresh_strings(): labels plus the text
+    # used by actions (status names, dialogs, context bar)
+    _I18N_KEYS = (
+        "writer.header",
+        "writer.placeholder",
+        "writer.translate_btn",
+        "writer.draft_only",
+        "writer.stop_btn",
+        "writer.draft_label",
+        "writer.final_label",
+        "writer.copy_btn",
+        "writer.copied",
+        "writer.refine_apply",
+        "writer.refine_applied",
+        "writer.title_placeholder",
+        "writer.view_content",
+        "writer.submit_btn",
+        "writer.submit_clipboard_msg",
+        "writer.generating",
+        "writer.context_new_post",
+        "writer.context_comment",
+        "writer.context_reply",
+        "writer.reply_to",
+        "writer.polish_in_progress_title",
+        "writer.polish_in_progress_msg",
+        "writer.cancel_and_new",
+        "writer.wait_for_finish",
+        "status.writer_draft",
+        "status.writer_polish",
+        "status.writer_refine",
+        "settings.model_role_logic",
+        "settings.model_role_persona",
+        "errors.model_not_configured",
+        "errors.model_not_configured_detail",
+        "errors.go_to_settings",
+    )
+
     _MAX_REFINE_MESSAGES = 20  # Keep conversations manageable for context window
+    TOKEN_FLUSH_MS = 40  # streamed tokens are written to the outputs at most this often
+    PREWARM_AFTER_TOKENS = 16  # draft tokens before the refine model is loaded
+    OUTPUT_MAX_BLOCKS = 5000  # lines kept in each output; a runaway generation drops the oldest
 
     def __init__(self, writer_service: WriterService, config, coordinator: TaskCoordinator, parent=None):
         super().__init__(parent)
         self._writer = writer_service
         self._config = config
         self._i18n = I18nManager()
+        self._last_locale_rev = -1  # I18nManager.revision at last retranslate_ui()
+        self._s: dict[str, str] = {}  # _I18N_KEYS -> text, see _refresh_strings()
+        self._comment_lang: str = ""  # refine explanation language, see _refresh_strings()
+        self._refine_seed: str = ""  # first refine request, see _refresh_strings()
         self._coordinator = coordinator
         self._pending_translate_text: Optional[str] = None  # queued text for after polish
+        self._pipeline_active: bool = False  # draft/refine run in flight (cleared on stop)
 
-        self._draft_worker: Optional[GenerationWorker] = None
-        self._polish_worker: Optional[GenerationWorker] = None
-        self._draft_text: str = ""  # collected draft for Stage 2 input
+        self._draft_text: str = ""  # finished draft for Stage 2 input
+        self._draft_buf: list[str] = []  # draft tokens not yet written to the output
+        self._final_buf: list[str] = []  # polish/refine text not yet written to the final output
+        self._final_parts: list[str] = []  # everything written to the final output (not block-capped)
+        self._draft_token_count: int = 0  # tokens received for the current draft
         self._current_activity_name: str = ""  # track last activity for finish signal
-        self._refine_worker: Optional[GenerationWorker] = None
-        self._refine_messages: list[dict] = []  # chat history for /api/chat
+        # Chat history for /api/chat: the system prompt plus the most recent turns
+        self._system_msg: Optional[dict] = None
+        self._refine_tail: deque[dict] = deque(maxlen=self._MAX_REFINE_MESSAGES - 1)
         self._pending_translation: Optional[str] = None  # Apply 대기 중인 수정안
         self._source_input_text: str = ""  # store for refine context
         self._current_context: Optional[WriterContext] = None
@@ -52,19 +116,45 @@ class WriterWidget(QWidget):
         # Streaming parse state: before "%%%" goes to final, after goes to chat
         self._refine_started: bool = False  # True after "%%%" is detected
         self._is_first_refine: bool = True  # first response splits to final+chat
-        self._chat_streamed_content: str = ""  # track what was sent to chat
-        self._token_buffer: str = ""  # buffer for detecting "%%%" across tokens
+        self._chat_streamed_parts: list[str] = []  # track what was sent to chat
+        self._held_tail: str = ""  # trailing whitespace/'%' held back: may precede "%%%"
+        # worker -> (generator_func, args, kwargs) to run once its stopped run exits
+        self._pending_starts: dict[GenerationWorker, tuple] = {}
 
         self._init_ui()
 
+        # Append cursors for the streamed outputs. A cursor that inserts stays
+        # at the end (and survives clear()), so it is never re-queried or moved.
+        # The final cursor is created with its widget in _ensure_final_widgets().
+        self._draft_cursor = QTextCursor(self._draft_output.document())
+        self._final_cursor: Optional[QTextCursor] = None
+
+        # One long-lived worker per stage; each run re-configures and restarts it
+        self._draft_worker = self._make_worker(
+            self._on_draft_tokens, self._on_draft_finished, self._on_error)
+        self._polish_worker = self._make_worker(
+            self._on_polish_tokens, self._on_polish_finished, self._on_error)
+        self._refine_worker = self._make_worker(
+            self._on_refine_tokens, self._on_refine_finished, self._on_refine_error)
+
         # Loading animation
         self._anim_timer = QTimer(self)
         self._anim_timer.setInterval(500)
         self._anim_timer.timeout.connect(self._animate_loading)
         self._anim_dot_count = 0
-        self._anim_target: Optional[QTextEdit] = None
+        self._anim_target: Optional[QPlainTextEdit] = None
+        self._anim_frames: tuple[str, ...] = ()  # placeholder text per dot count
+
+        # Coalesces streamed tokens into one insert per tick
+        self._token_flush_timer = QTimer(self)
+        self._token_flush_timer.setSingleShot(True)
+        self._token_flush_timer.setInterval(self.TOKEN_FLUSH_MS)
+        self._token_flush_timer.timeout.connect(self._flush_tokens)
 
     def _init_ui(self):
+        self._refresh_strings()
+        s = self._s
+        self.setStyleSheet(_WRITER_QSS)
         # Top-level vertical layout: context bar + content
         root_layout = QVBoxLayout(self)
         root_layout.setContentsMargins(0, 0, 0, 0)
@@ -81,27 +171,19 @@ class WriterWidget(QWidget):
 
         ctx_top_row = QHBoxLayout()
         self._context_info_label = QLabel()
-        self._context_info_label.setStyleSheet(
-            "color: #e0e0e0; font-size: 13px; font-weight: bold;"
-        )
+        self._context_info_label.setObjectName("writerContextInfo")
         ctx_top_row.addWidget(self._context_info_label)
         ctx_top_row.addStretch()
 
-        self._view_content_btn = QPushButton(self._i18n.get("writer.view_content"))
+        self._view_content_btn = QPushButton(s["writer.view_content"])
         self._view_content_btn.setFixedWidth(80)
-        self._view_content_btn.setStyleSheet(
-            "QPushButton { background-color: #2d5a8f; color: white; "
-            "border: none; border-radius: 4px; padding: 4px 8px; font-size: 12px; }"
-            "QPushButton:hover { background-color: #3d6a9f; }"
-        )
+        self._view_content_btn.setObjectName("writerViewContent")
         self._view_content_btn.clicked.connect(self._on_view_content)
         ctx_top_row.addWidget(self._view_content_btn)
         ctx_layout.addLayout(ctx_top_row)
 
         self._context_detail_label = QLabel()
-        self._context_detail_label.setStyleSheet(
-            "color: #aaaacc; font-size: 12px;"
-        )
+        self._context_detail_label.setObjectName("writerContextDetail")
         self._context_detail_label.setWordWrap(True)
         self._context_detail_label.hide()
         ctx_layout.addWidget(self._context_detail_label)
@@ -119,35 +201,35 @@ class WriterWidget(QWidget):
         layout.setContentsMargins(8, 8, 4, 8)
 
         # Header
-        self._header = QLabel(self._i18n.get("writer.header"))
-        self._header.setStyleSheet("font-size: 16px; font-weight: bold;")
+        self._header = QLabel(s["writer.header"])
+        self._header.setObjectName("writerHeader")
         layout.addWidget(self._header)
 
         # Title input (new_post mode only, hidden by default)
         self._title_input = QLineEdit()
-        self._title_input.setPlaceholderText(self._i18n.get("writer.title_placeholder"))
+        self._title_input.setPlaceholderText(s["writer.title_placeholder"])
         self._title_input.hide()
         layout.addWidget(self._title_input)
 
         # Korean input
         self._input = QTextEdit()
-        self._input.setPlaceholderText(self._i18n.get("writer.placeholder"))
+        self._input.setPlaceholderText(s["writer.placeholder"])
         self._input.setMaximumHeight(150)
         layout.addWidget(self._input)
 
         # Button row
         btn_layout = QHBoxLayout()
 
-        self._translate_btn = QPushButton(self._i18n.get("writer.translate_btn"))
+        self._translate_btn = QPushButton(s["writer.translate_btn"])
         self._translate_btn.clicked.connect(self._on_translate)
         btn_layout.addWidget(self._translate_btn)
 
-        self._draft_only_cb = QCheckBox(self._i18n.get("writer.draft_only"))
+        self._draft_only_cb = QCheckBox(s["writer.draft_only"])
         btn_layout.addWidget(self._draft_only_cb)
 
         btn_layout.addStretch()
 
-        self._stop_btn = QPushButton(self._i18n.get("writer.stop_btn"))
+        self._stop_btn = QPushButton(s["writer.stop_btn"])
         self._stop_btn.clicked.connect(self._on_stop)
         self._stop_btn.setEnabled(False)
         btn_layout.addWidget(self._stop_btn)
@@ -155,47 +237,42 @@ class WriterWidget(QWidget):
         layout.addLayout(btn_layout)
 
         # Stage 1: Draft
-        self._draft_label = QLabel(self._i18n.get("writer.draft_label"))
-        self._draft_label.setStyleSheet("font-weight: bold;")
+        self._draft_label = QLabel(s["writer.draft_label"])
+        self._draft_label.setObjectName("writerDraftLabel")
         layout.addWidget(self._draft_label)
 
-        self._draft_output = QTextEdit()
+        self._draft_output = QPlainTextEdit()
         self._draft_output.setReadOnly(True)
+        self._draft_output.document().setUndoRedoEnabled(False)
+        self._draft_output.setMaximumBlockCount(self.OUTPUT_MAX_BLOCKS)
         layout.addWidget(self._draft_output)
 
-        # Stage 2: Final
-        self._final_label = QLabel(self._i18n.get("writer.final_label"))
-        self._final_label.setStyleSheet("font-weight: bold;")
-        layout.addWidget(self._final_label)
-
-        self._final_output = QTextEdit()
-        self._final_output.setReadOnly(True)
-        layout.addWidget(self._final_output)
+        # Stage 2: Final - created on first use by _ensure_final_widgets(),
+        # so draft-only sessions never build it
+        self._final_label: Optional[QLabel] = None
+        self._final_output: Optional[QPlainTextEdit] = None
+        self._output_layout = layout
+        self._final_insert_index = layout.count()
 
         # Bottom buttons: Copy + Apply + Submit
         bottom_btn_layout = QHBoxLayout()
 
-        self._copy_btn = QPushButton(self._i18n.get("writer.copy_btn"))
+        self._copy_btn = QPushButton(s["writer.copy_btn"])
         self._copy_btn.clicked.connect(self._on_copy)
         self._copy_btn.setEnabled(False)
         bottom_btn_layout.addWidget(self._copy_btn)
 
-        self._apply_btn = QPushButton(self._i18n.get("writer.refine_apply"))
+        self._apply_btn = QPushButton(s["writer.refine_apply"])
         self._apply_btn.clicked.connect(self._on_apply)
         self._apply_btn.setEnabled(False)
         bottom_btn_layout.addWidget(self._apply_btn)
 
         bottom_btn_layout.addStretch()
 
-        self._submit_btn = QPushButton(self._i18n.get("writer.submit_btn"))
+        self._submit_btn = QPushButton(s["writer.submit_btn"])
         self._submit_btn.clicked.connect(self._on_submit)
         self._submit_btn.setEnabled(False)
-        self._submit_btn.setStyleSheet(
-            "QPushButton { background-color: #2d6b3d; color: white; "
-            "border: none; border-radius: 4px; padding: 6px 16px; font-weight: bold; }"
-            "QPushButton:hover { background-color: #3d8b4d; }"
-            "QPushButton:disabled { background-color: #444444; color: #888888; }"
-        )
+        self._submit_btn.setObjectName("writerSubmit")
         bottom_btn_layout.addWidget(self._submit_btn)
 
         layout.addLayout(bottom_btn_layout)
@@ -220,18 +297,18 @@ class WriterWidget(QWidget):
             return True
 
         role_names = {
-            "logic": self._i18n.get("settings.model_role_logic"),
-            "persona": self._i18n.get("settings.model_role_persona"),
+            "logic": self._s["settings.model_role_logic"],
+            "persona": self._s["settings.model_role_persona"],
         }
         missing_names = ", ".join(role_names.get(r, r) for r in missing)
 
         msg = QMessageBox(self)
-        msg.setWindowTitle(self._i18n.get("errors.model_not_configured"))
-        msg.setText(self._i18n.get("errors.model_not_configured_detail").replace("{models}", missing_names))
+        msg.setWindowTitle(self._s["errors.model_not_configured"])
+        msg.setText(self._s["errors.model_not_configured_detail"].replace("{models}", missing_names))
         msg.setIcon(QMessageBox.Icon.Warning)
 
         settings_btn = msg.addButton(
-            self._i18n.get("errors.go_to_settings"),
+            self._s["errors.go_to_settings"],
             QMessageBox.ButtonRole.AcceptRole,
         )
         msg.addButton(QMessageBox.StandardButton.Cancel)
@@ -254,6 +331,11 @@ class WriterWidget(QWidget):
             title = self._title_input.text().strip()
             source_text = f"Title: {title}\n\n{body_text}"
 
+        # Same text as the run in flight (or already queued): nothing new to do
+        if source_text == self._pending_translate_text or (
+                source_text == self._source_input_text and self._pipeline_active):
+            return
+
         # Check if required models are configured
         roles = ["logic"] if self._draft_only_cb.isChecked() else ["logic", "persona"]
         if not self._check_models_configured(roles):
@@ -269,16 +351,16 @@ class WriterWidget(QWidget):
     def _show_polish_conflict_dialog(self, source_text: str):
         """Show dialog when user tries to translate while polish is running."""
         msg = QMessageBox(self)
-        msg.setWindowTitle(self._i18n.get("writer.polish_in_progress_title"))
-        msg.setText(self._i18n.get("writer.polish_in_progress_msg"))
+        msg.setWindowTitle(self._s["writer.polish_in_progress_title"])
+        msg.setText(self._s["writer.polish_in_progress_msg"])
         msg.setIcon(QMessageBox.Icon.Information)
 
         cancel_btn = msg.addButton(
-            self._i18n.get("writer.cancel_and_new"),
+            self._s["writer.cancel_and_new"],
             QMessageBox.ButtonRole.AcceptRole,
         )
         wait_btn = msg.addButton(
-            self._i18n.get("writer.wait_for_finish"),
+            self._s["writer.wait_for_finish"],
             QMessageBox.ButtonRole.RejectRole,
         )
         msg.setDefaultButton(wait_btn)
@@ -303,12 +385,20 @@ class WriterWidget(QWidget):
 
     def _start_translation_pipeline(self, source_text: str):
         """Start the full translation pipeline (draft + refine)."""
+        # Translating the same text again means "give me a new draft"
+        use_cache = source_text != self._source_input_text
         # Reset outputs
+        self._discard_tokens()
         self._draft_output.clear()
-        self._final_output.clear()
+        if self._final_output is not None:
+            self._final_output.clear()
+        self._final_parts.clear()
         self._draft_text = ""
+        self._draft_token_count = 0
         self._source_input_text = source_text
-        self._refine_messages = []
+        self._pipeline_active = True
+        self._system_msg = None
+        self._refine_tail.clear()
         self._pending_translation = None
         self._apply_btn.setEnabled(False)
         self._refine_chat.clear_chat()
@@ -319,35 +409,86 @@ class WriterWidget(QWidget):
         # UI state: translating
         self._translate_btn.setEnabled(False)
         self._stop_btn.setEnabled(True)
-        self._current_activity_name = self._i18n.get("status.writer_draft")
+        self._current_activity_name = self._s["status.writer_draft"]
         self.activity_started.emit(self._current_activity_name)
 
         # Start Stage 1
-        self._start_draft(source_text)
-
-    def _start_draft(self, source_text: str):
+        self._start_draft(source_text, use_cache=use_cache)
+
+    def _ensure_final_widgets(self) -> QPlainTextEdit:
+        """Create the Stage 2 label and output on first use and return the output."""
+        if self._final_output is None:
+            self._final_label = QLabel(self._s["writer.final_label"])
+            self._final_label.setObjectName("writerFinalLabel")
+            self._final_output = QPlainTextEdit()
+            self._final_output.setReadOnly(True)
+            self._final_output.document().setUndoRedoEnabled(False)
+            self._final_output.setMaximumBlockCount(self.OUTPUT_MAX_BLOCKS)
+            self._output_layout.insertWidget(self._final_insert_index, self._final_label)
+            self._output_layout.insertWidget(self._final_insert_index + 1, self._final_output)
+            self._final_cursor = QTextCursor(self._final_output.document())
+        return self._final_output
+
+    def _make_worker(self, on_tokens, on_finished, on_error) -> GenerationWorker:
+        """Create a stage worker with its signals connected once."""
+        worker = GenerationWorker(self)
+        worker.tokens_ready.connect(lambda: on_tokens(worker.drain_tokens()))
+        worker.finished_signal.connect(on_finished)
+        worker.error_occurred.connect(on_error)
+        worker.finished.connect(lambda w=worker: self._start_pending(w))
+        return worker
+
+    def _start_worker(self, worker: GenerationWorker, generator_func, *args, **kwargs):
+        """Run a job on *worker* without blocking the UI thread.
+
+        If a previous run is still winding down, it is asked to stop and
+        the job starts from the worker's finished signal instead of waiting
+        on the thread here.
+        """
+        if worker.isRunning():
+            worker.stop()
+            self._pending_starts[worker] = (generator_func, args, kwargs)
+            return
+        worker.configure(generator_func, *args, **kwargs)
+        worker.start()
+
+    def _start_pending(self, worker: GenerationWorker):
+        """Start the job queued by _start_worker() once *worker* has exited."""
+        job = self._pending_starts.pop(worker, None)
+        if job is not None:
+            generator_func, args, kwargs = job
+            worker.configure(generator_func, *args, **kwargs)
+            worker.start()
+
+    def _start_draft(self, source_text: str, use_cache: bool = True):
         """Stage 1: Source language -> target language draft."""
-        if self._draft_worker and self._draft_worker.isRunning():
-            self._draft_worker.stop()
-            self._draft_worker.wait(2000)
-
-        self._draft_worker = GenerationWorker()
-        self._draft_worker.token_received.connect(self._on_draft_token)
-        self._draft_worker.finished_signal.connect(self._on_draft_finished)
-        self._draft_worker.error_occurred.connect(self._on_error)
-        self._draft_worker.configure(self._writer.draft, source_text)
+        cached = self._writer.cached_draft(source_text) if use_cache else None
+        if cached is not None:
+            # Same text and settings as an earlier run: reuse its draft. Called
+            # directly so a Stop or new Translate cannot slip in before it runs
+            self._draft_output.setPlainText(cached)
+            self._on_draft_finished(cached)
+            return
+
         self._start_loading_animation(self._draft_output)
-        self._draft_worker.start()
+        self._start_worker(self._draft_worker, self._writer.draft, source_text)
 
-    def _on_draft_token(self, token: str):
+    def _on_draft_tokens(self, tokens: list[str]):
         self._stop_loading_animation()
-        cursor = self._draft_output.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        cursor.insertText(token)
-        self._draft_text += token
+        self._draft_buf.extend(tokens)
+        if not self._token_flush_timer.isActive():
+            self._token_flush_timer.start()
+        seen = self._draft_token_count
+        self._draft_token_count += len(tokens)
+        if (seen < self.PREWARM_AFTER_TOKENS <= self._draft_token_count
+                and not self._draft_only_cb.isChecked()):
+            # Load the refine model while the draft finishes streaming
+            QThreadPool.globalInstance().start(self._writer.prewarm_refine)
 
     def _on_draft_finished(self, full_text: str):
+        self._flush_tokens()
         self._draft_text = full_text
+        self._writer.remember_draft(self._source_input_text, full_text)
 
         # Check if draft only
         if self._draft_only_cb.isChecked():
@@ -362,35 +503,50 @@ class WriterWidget(QWidget):
 
     def _start_polish(self, english_draft: str):
         """Stage 2: English -> Reddit-ready."""
-        if self._polish_worker and self._polish_worker.isRunning():
-            self._polish_worker.stop()
-            self._polish_worker.wait(2000)
-
-        self._polish_worker = GenerationWorker()
-        self._polish_worker.token_received.connect(self._on_polish_token)
-        self._polish_worker.finished_signal.connect(self._on_polish_finished)
-        self._polish_worker.error_occurred.connect(self._on_error)
-        self._polish_worker.configure(
-            self._writer.polish, english_draft,
+        self._start_loading_animation(self._ensure_final_widgets())
+        self._current_activity_name = self._s["status.writer_polish"]
+        self.activity_started.emit(self._current_activity_name)
+        self._start_worker(
+            self._polish_worker, self._writer.polish, english_draft,
             korean_text=self._source_input_text, context=self._current_context
         )
-        self._start_loading_animation(self._final_output)
-        self._current_activity_name = self._i18n.get("status.writer_polish")
-        self.activity_started.emit(self._current_activity_name)
-        self._polish_worker.start()
 
-    def _on_polish_token(self, token: str):
+    def _on_polish_tokens(self, tokens: list[str]):
         self._stop_loading_animation()
-        cursor = self._final_output.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        cursor.insertText(token)
+        self._append_final(tokens)
+
+    def _append_final(self, chunks: list[str]):
+        """Queue text for the final output; it is written on the next flush."""
+        self._final_buf.extend(chunks)
+        if not self._token_flush_timer.isActive():
+            self._token_flush_timer.start()
+
+    def _flush_tokens(self):
+        """Append buffered draft/final text to the outputs in one insert each."""
+        self._token_flush_timer.stop()
+        if self._draft_buf:
+            self._draft_cursor.insertText("".join(self._draft_buf))
+            self._draft_buf.clear()
+        if self._final_buf:
+            text = "".join(self._final_buf)
+            self._final_cursor.insertText(text)
+            self._final_parts.append(text)
+            self._final_buf.clear()
+
+    def _discard_tokens(self):
+        """Drop buffered tokens that have not been written yet."""
+        self._token_flush_timer.stop()
+        self._draft_buf.clear()
+        self._final_buf.clear()
 
     def _on_polish_finished(self, full_text: str):
+        self._flush_tokens()
         # Note: Polish stage is now skipped, this method kept for compatibility
         self._on_all_done()
 
     def _on_all_done(self):
         """Pipeline complete. Restore button state and notify coordinator."""
+        self._pipeline_active = False
         self._translate_btn.setEnabled(True)
         self._stop_btn.setEnabled(False)
         self._copy_btn.setEnabled(True)
@@ -403,137 +559,127 @@ class WriterWidget(QWidget):
 
     def _on_stop(self):
         """Stop current generation."""
-        if self._draft_worker and self._draft_worker.isRunning():
-            self._draft_worker.stop()
-        if self._polish_worker and self._polish_worker.isRunning():
-            self._polish_worker.stop()
-        if self._refine_worker and self._refine_worker.isRunning():
-            self._refine_worker.stop()
+        self._pending_starts.clear()
+        for worker in (self._draft_worker, self._polish_worker, self._refine_worker):
+            if worker.isRunning():
+                worker.stop()
+        self._flush_tokens()
         self._on_all_done()
 
     def _on_error(self, error_key: str):
-        self._final_output.setPlainText(self._i18n.get(error_key))
+        self._flush_tokens()
+        self._set_final_text(self._i18n.get(error_key))
         self._on_all_done()
 
+    def _set_final_text(self, text: str):
+        """Replace the final output and the text copy/submit read back."""
+        self._ensure_final_widgets().setPlainText(text)
+        self._final_parts = [text]
+
     def _on_copy(self):
         """Copy final output (or draft if draft-only) to clipboard."""
-        text = self._final_output.toPlainText()
+        self._flush_tokens()
+        # Read the held strings: the outputs keep only OUTPUT_MAX_BLOCKS
+        # blocks. Only a stopped draft needs to be read back from the document.
+        text = "".join(self._final_parts)
         if not text:
-            text = self._draft_output.toPlainText()
+            text = self._draft_text or self._draft_output.toPlainText()
         if text:
             clipboard = QApplication.clipboard()
             clipboard.setText(text)
-            self._copy_btn.setText(self._i18n.get("writer.copied"))
+            self._copy_btn.setText(self._s["writer.copied"])
             # Reset after 2 seconds would need a QTimer, keep simple for now
 
     def _start_refine_chat(self):
         """Start the refine chat session - creates 2nd translation + explanation."""
-        # Determine comment language from current locale
-        locale = self._i18n.locale
-        comment_lang = "한국어" if locale.startswith("ko") else "English"
-
         # Reset streaming state
         self._refine_started = False
         self._is_first_refine = True
-        self._chat_streamed_content = ""
-        self._token_buffer = ""
+        self._chat_streamed_parts = []
+        self._held_tail = ""
 
         # Show loading in final output first (before chat bubble appears)
-        self._start_loading_animation(self._final_output)
+        self._start_loading_animation(self._ensure_final_widgets())
 
         # Build initial context (refine will create 2nd translation)
-        self._refine_messages = self._writer.build_refine_context(
+        self._system_msg, *rest = self._writer.build_refine_context(
             self._source_input_text,
             self._draft_text,
-            comment_lang=comment_lang,
+            comment_lang=self._comment_lang,
             context=self._current_context,
         )
+        self._refine_tail.clear()
+        self._refine_tail.extend(rest)
         # Don't enable chat input until translation is done
         self._refine_chat.set_input_enabled(False)
         # Add seed message requesting translation + explanation
-        seed = ("2차 번역을 작성하고 왜 그렇게 바꿨는지 설명해 주세요."
-                if locale.startswith("ko")
-                else "Create the polished translation and explain your changes.")
-        self._refine_messages.append({
+        self._refine_tail.append({
             "role": "user",
-            "content": seed,
+            "content": self._refine_seed,
         })
         # Auto-generate first AI response (translation + explanation)
         self._send_refine_request()
 
     def _on_refine_message(self, text: str):
         """Handle user message from refine chat."""
-        self._refine_messages.append({"role": "user", "content": text})
+        self._refine_tail.append({"role": "user", "content": text})
         self._refine_chat.set_input_enabled(False)
         # Reset streaming state for follow-up
         self._refine_started = False
         self._is_first_refine = False  # Follow-up goes entirely to chat
-        self._chat_streamed_content = ""
-        self._token_buffer = ""
+        self._chat_streamed_parts = []
+        self._held_tail = ""
         self._send_refine_request()
 
-    def _on_refine_token(self, token: str):
-        """Handle streaming token - route to final output or chat based on '%%%' detection."""
+    def _on_refine_tokens(self, tokens: list[str]):
+        """Handle streamed tokens - route to final output or chat based on '%%%' detection."""
+        token = "".join(tokens)
         # For follow-up messages, everything goes to chat
         if not self._is_first_refine:
             self._refine_chat.append_to_streaming_message(token)
-            self._chat_streamed_content += token
+            self._chat_streamed_parts.append(token)
             return
 
         # First response: split at "%%%" - before goes to final, after goes to chat
         if self._refine_started:
             # Already past "%%%", send to chat
             self._refine_chat.append_to_streaming_message(token)
-            self._chat_streamed_content += token
+            self._chat_streamed_parts.append(token)
         else:
-            # Buffer tokens to detect "%%%" that might be split across tokens
-            self._token_buffer += token
-
-            if "%%%" in self._token_buffer:
-                idx = self._token_buffer.index("%%%")
+            # Only the held tail (a few chars) is carried between tokens
+            text = self._held_tail + token if self._held_tail else token
+            idx = text.find("%%%")
+            if idx >= 0:
                 # Text before "%%%" goes to final output
-                before = self._token_buffer[:idx].rstrip()  # strip trailing newline
+                before = text[:idx].rstrip()  # strip trailing newline
                 if before:
                     self._stop_loading_animation()
-                    cursor = self._final_output.textCursor()
-                    cursor.movePosition(cursor.MoveOperation.End)
-                    cursor.insertText(before)
+                    self._append_final([before])
                 # Now start the chat bubble for explanation
                 self._refine_chat.start_streaming_ai_message()
                 # After "%%%" goes to chat (skip the delimiter itself)
-                after = self._token_buffer[idx + 3:].lstrip()  # strip leading newline
+                after = text[idx + 3:].lstrip()  # strip leading newline
                 if after:
                     self._refine_chat.append_to_streaming_message(after)
-                    self._chat_streamed_content += after
-                self._token_buffer = ""
+                    self._chat_streamed_parts.append(after)
+                self._held_tail = ""
                 self._refine_started = True
-            elif len(self._token_buffer) > 5:
-                # Safe to output (keep last 3 chars in buffer for "%%%" detection)
-                self._stop_loading_animation()
-                output = self._token_buffer[:-3]
-                self._token_buffer = self._token_buffer[-3:]
-                cursor = self._final_output.textCursor()
-                cursor.movePosition(cursor.MoveOperation.End)
-                cursor.insertText(output)
+            else:
+                # Emit all but a trailing run of up to two '%' (and the
+                # whitespace before it), which a "%%%" split across tokens
+                # would start with
+                keep = len(text.rstrip("%").rstrip())
+                if keep:
+                    self._stop_loading_animation()
+                    self._append_final([text[:keep]])
+                self._held_tail = text[keep:]
 
     def _send_refine_request(self):
         """Send current messages to AI for refine response."""
-        if self._refine_worker and self._refine_worker.isRunning():
+        if self._refine_worker.isRunning():
             self._refine_worker.stop()
-            self._refine_worker.wait(2000)
 
-        # Prune old messages if conversation is too long (keep system + recent)
-        if len(self._refine_messages) > self._MAX_REFINE_MESSAGES:
-            system_msg = self._refine_messages[0]  # Always keep system prompt
-            self._refine_messages = [system_msg] + self._refine_messages[-(self._MAX_REFINE_MESSAGES - 1):]
-
-        self._refine_worker = GenerationWorker()
-        self._refine_worker.token_received.connect(self._on_refine_token)
-        self._refine_worker.finished_signal.connect(self._on_refine_finished)
-        self._refine_worker.error_occurred.connect(self._on_refine_error)
-        self._refine_worker.configure(self._writer.refine, self._refine_messages)
-
-        self._current_activity_name = self._i18n.get("status.writer_refine")
+        self._current_activity_name = self._s["status.writer_refine"]
         self.activity_started.emit(self._current_activity_name)
 
         # Request exclusive access (blocks reader tasks during refine)
@@ -545,7 +691,8 @@ class WriterWidget(QWidget):
         # For first refine, don't show chat bubble until translation is done (%%% detected)
         if not self._is_first_refine:
             self._refine_chat.start_streaming_ai_message()
-        self._refine_worker.start()
+        self._start_worker(self._refine_worker, self._writer.refine,
+                           [self._system_msg, *self._refine_tail])
 
     def _on_refine_finished(self, full_text: str):
         """Handle completed refine response."""
@@ -553,18 +700,17 @@ class WriterWidget(QWidget):
         self._stop_loading_animation()
 
         # Flush any remaining buffer
-        if self._token_buffer and self._is_first_refine and not self._refine_started:
+        if self._held_tail and self._is_first_refine and not self._refine_started:
             # No "%%%" was found, remaining buffer is translation
-            cursor = self._final_output.textCursor()
-            cursor.movePosition(cursor.MoveOperation.End)
-            cursor.insertText(self._token_buffer)
-            self._token_buffer = ""
+            self._final_buf.append(self._held_tail)
+            self._held_tail = ""
+        self._flush_tokens()
 
         # Append assistant response to history
-        self._refine_messages.append({"role": "assistant", "content": full_text})
+        self._refine_tail.append({"role": "assistant", "content": full_text})
 
         # Finish the chat bubble with accumulated content
-        self._refine_chat.finish_streaming_message(self._chat_streamed_content.strip())
+        self._refine_chat.finish_streaming_message("".join(self._chat_streamed_parts).strip())
 
         if self._is_first_refine:
             # First response: translation already in final output via streaming
@@ -578,6 +724,7 @@ class WriterWidget(QWidget):
                     self._refine_chat.add_translation_suggestion(translation)
 
         self._refine_chat.set_input_enabled(True)
+        self._pipeline_active = False
         self._translate_btn.setEnabled(True)
         self._stop_btn.setEnabled(False)
         if self._coordinator.is_exclusive_active():
@@ -585,20 +732,22 @@ class WriterWidget(QWidget):
 
     def _on_refine_error(self, error_key: str):
         """Handle refine chat error."""
+        self._flush_tokens()
         self.activity_finished.emit(self._current_activity_name)
         self._refine_chat.add_ai_message(self._i18n.get(error_key))
         self._refine_chat.set_input_enabled(True)
+        self._pipeline_active = False
         if self._coordinator.is_exclusive_active():
             self._coordinator.finish_exclusive()
 
     def _on_apply(self):
         """Apply the pending translation to Stage 2 output."""
         if self._pending_translation:
-            self._final_output.setPlainText(self._pending_translation)
+            self._set_final_text(self._pending_translation)
             self._pending_translation = None
             self._apply_btn.setEnabled(False)
             # Show confirmation in chat
-            self._refine_chat.add_ai_message(self._i18n.get("writer.refine_applied"))
+            self._refine_chat.add_ai_message(self._s["writer.refine_applied"])
 
     def _on_translation_suggested(self, translation: str):
         """Handle translation suggestion from chat (signal receiver)."""
@@ -611,10 +760,13 @@ class WriterWidget(QWidget):
         self._update_context_bar()
         # Reset outputs for new context
         self._draft_output.clear()
-        self._final_output.clear()
+        if self._final_output is not None:
+            self._final_output.clear()
+        self._final_parts.clear()
         self._input.clear()
         self._refine_chat.clear_chat()
-        self._refine_messages = []
+        self._system_msg = None
+        self._refine_tail.clear()
         self._pending_translation = None
         self._apply_btn.setEnabled(False)
         self._submit_btn.setEnabled(False)
@@ -640,13 +792,13 @@ class WriterWidget(QWidget):
         self._context_bar.show()
 
         if ctx.mode == "new_post":
-            mode_text = self._i18n.get("writer.context_new_post")
+            mode_text = self._s["writer.context_new_post"]
             self._context_info_label.setText(f"{mode_text} — r/{ctx.subreddit}")
             self._context_detail_label.hide()
             self._title_input.show()
             self._view_content_btn.hide()
         elif ctx.mode == "comment":
-            mode_text = self._i18n.get("writer.context_comment")
+            mode_text = self._s["writer.context_comment"]
             title_excerpt = ctx.post_title[:60] + "..." if len(ctx.post_title) > 60 else ctx.post_title
             self._context_info_label.setText(
                 f"{mode_text} — r/{ctx.subreddit} > \"{title_excerpt}\""
@@ -655,13 +807,13 @@ class WriterWidget(QWidget):
             self._title_input.hide()
             self._view_content_btn.setVisible(bool(ctx.post_selftext))
         elif ctx.mode == "reply":
-            mode_text = self._i18n.get("writer.context_reply")
+            mode_text = self._s["writer.context_reply"]
             title_excerpt = ctx.post_title[:60] + "..." if len(ctx.post_title) > 60 else ctx.post_title
             self._context_info_label.setText(
                 f"{mode_text} — r/{ctx.subreddit} > \"{title_excerpt}\""
             )
             # Show reply target
-            reply_text = self._i18n.get("writer.reply_to").replace("{author}", ctx.comment_author)
+            reply_text = self._s["writer.reply_to"].replace("{author}", ctx.comment_author)
             body_excerpt = ctx.comment_body[:100] + "..." if len(ctx.comment_body) > 100 else ctx.comment_body
             self._context_detail_label.setText(f"{reply_text}: \"{body_excerpt}\"")
             self._context_detail_label.show()
@@ -678,10 +830,11 @@ class WriterWidget(QWidget):
 
     def _on_submit(self):
         """Submit the final text to Reddit via browser."""
-        # Get the final text
-        final_text = self._final_output.toPlainText().strip()
+        # Get the final text (held strings, as in _on_copy)
+        self._flush_tokens()
+        final_text = "".join(self._final_parts).strip()
         if not final_text:
-            final_text = self._draft_output.toPlainText().strip()
+            final_text = (self._draft_text or self._draft_output.toPlainText()).strip()
         if not final_text:
             return
 
@@ -705,14 +858,14 @@ class WriterWidget(QWidget):
             clipboard.setText(final_text)
             url = f"https://www.reddit.com{ctx.post_permalink}"
             QDesktopServices.openUrl(QUrl(url))
-            self._status_message(self._i18n.get("writer.submit_clipboard_msg"))
+            self._status_message(self._s["writer.submit_clipboard_msg"])
         elif ctx.mode == "reply":
             # Copy text to clipboard and open comment permalink
             clipboard = QApplication.clipboard()
             clipboard.setText(final_text)
             url = f"https://www.reddit.com{ctx.post_permalink}{ctx.comment_id}/"
             QDesktopServices.openUrl(QUrl(url))
-            self._status_message(self._i18n.get("writer.submit_clipboard_msg"))
+            self._status_message(self._s["writer.submit_clipboard_msg"])
 
     def _status_message(self, msg: str):
         """Show status message via parent's status bar if available."""
@@ -722,25 +875,46 @@ class WriterWidget(QWidget):
 
     def retranslate_ui(self):
         """Update all labels for locale change."""
-        self._header.setText(self._i18n.get("writer.header"))
-        self._input.setPlaceholderText(self._i18n.get("writer.placeholder"))
-        self._translate_btn.setText(self._i18n.get("writer.translate_btn"))
-        self._draft_only_cb.setText(self._i18n.get("writer.draft_only"))
-        self._stop_btn.setText(self._i18n.get("writer.stop_btn"))
-        self._draft_label.setText(self._i18n.get("writer.draft_label"))
-        self._final_label.setText(self._i18n.get("writer.final_label"))
-        self._copy_btn.setText(self._i18n.get("writer.copy_btn"))
-        self._apply_btn.setText(self._i18n.get("writer.refine_apply"))
-        self._title_input.setPlaceholderText(self._i18n.get("writer.title_placeholder"))
-        self._view_content_btn.setText(self._i18n.get("writer.view_content"))
-        self._submit_btn.setText(self._i18n.get("writer.submit_btn"))
+        rev = self._i18n.revision
+        if rev == self._last_locale_rev:
+            return
+        self._last_locale_rev = rev
+        self._refresh_strings()
+        s = self._s
+        self._header.setText(s["writer.header"])
+        self._input.setPlaceholderText(s["writer.placeholder"])
+        self._translate_btn.setText(s["writer.translate_btn"])
+        self._draft_only_cb.setText(s["writer.draft_only"])
+        self._stop_btn.setText(s["writer.stop_btn"])
+        self._draft_label.setText(s["writer.draft_label"])
+        if self._final_label is not None:
+            self._final_label.setText(s["writer.final_label"])
+        self._copy_btn.setText(s["writer.copy_btn"])
+        self._apply_btn.setText(s["writer.refine_apply"])
+        self._title_input.setPlaceholderText(s["writer.title_placeholder"])
+        self._view_content_btn.setText(s["writer.view_content"])
+        self._submit_btn.setText(s["writer.submit_btn"])
+        if self._anim_target is not None:
+            self._build_anim_frames()
         self._update_context_bar()  # refresh context labels
         self._refine_chat.retranslate_ui()
 
-    def _start_loading_animation(self, target: QTextEdit):
+    def _refresh_strings(self):
+        """Resolve _I18N_KEYS and the refine prompt language for the current locale."""
+        self._s = self._i18n.snapshot(self._I18N_KEYS)
+        # Refine explanations and the seed request follow the UI language
+        if self._i18n.locale.startswith("ko"):
+            self._comment_lang = "한국어"
+            self._refine_seed = "2차 번역을 작성하고 왜 그렇게 바꿨는지 설명해 주세요."
+        else:
+            self._comment_lang = "English"
+            self._refine_seed = "Create the polished translation and explain your changes."
+
+    def _start_loading_animation(self, target: QPlainTextEdit):
         """Start animated '생성 중...' in a text area."""
         self._anim_target = target
         self._anim_dot_count = 0
+        self._build_anim_frames()
         self._anim_timer.start()
         self._animate_loading()  # show immediately
 
@@ -749,13 +923,20 @@ class WriterWidget(QWidget):
         self._anim_timer.stop()
         self._anim_target = None
 
+    def _build_anim_frames(self):
+        """Precompute the placeholder text for each dot count."""
+        base = self._s["writer.generating"].rstrip(".")
+        self._anim_frames = tuple(base + "." * i for i in range(4))
+
     def _animate_loading(self):
         """Update the animated loading text."""
-        if self._anim_target is None:
+        target = self._anim_target
+        if target is None:
+            return
+        if not target.document().isEmpty():
+            # Placeholder is hidden behind content; nothing left to animate
+            self._stop_loading_animation()
             return
         self._anim_dot_count = (self._anim_dot_count + 1) % 4
-        dots = "." * self._anim_dot_count
-        base = self._i18n.get("writer.generating")
-        # Remove trailing dots from base and add animated dots
-        base_clean = base.rstrip(".")
-        self._anim_target.setPlaceholderText(f"{base_clean}{dots}")
+        if target.isVisible():
+            target.setPlaceholderText(self._anim_frames[self._anim_dot_count])
@@ -1,9 +1,10 @@
-"""QThread workers for background operations."""
+"""QThread workers (and pooled tasks) for background operations."""
 
 import logging
+import queue
 from typing import Optional, Callable
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThread, pyqtSignal
 
 from src.core.exceptions import ReddiScribeError
 from src.core.types import PostDTO, CommentDTO
@@ -114,16 +115,21 @@ class GenerationWorker(QThread):
     - Draft generation - Writer Stage 1 (WriterService)
     - Polish generation - Writer Stage 2 (WriterService)
     """
-    token_received = pyqtSignal(str)     # individual token for streaming display
+    tokens_ready = pyqtSignal()          # new tokens queued; collect them with drain_tokens()
     finished_signal = pyqtSignal(str)    # complete text when done
     error_occurred = pyqtSignal(str)     # i18n error key
+    parsed_signal = pyqtSignal(dict)     # post-processed results (see configure_post_process)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._generator: Optional[Callable] = None
         self._generator_args: tuple = ()
         self._generator_kwargs: dict = {}
+        self._post_feed: Optional[Callable[[str], dict]] = None
+        self._post_close: Optional[Callable[[], dict]] = None
         self._stopped = False
+        self._tokens: queue.SimpleQueue = queue.SimpleQueue()
+        self._wakeup_pending = False  # tokens_ready emitted, not yet drained
 
     def configure(self, generator_func: Callable, *args, **kwargs):
         """Configure the generator function to run.
@@ -137,6 +143,40 @@ class GenerationWorker(QThread):
         self._generator_args = args
         self._generator_kwargs = kwargs
         self._stopped = False
+        # Fresh queue: tokens a stopped earlier run left behind are dropped
+        self._tokens = queue.SimpleQueue()
+        self._wakeup_pending = False
+
+    def drain_tokens(self) -> list[str]:
+        """Return (and remove) all streamed tokens queued so far, in order.
+
+        Called from the UI thread in response to tokens_ready. Tokens queued
+        after the flag is cleared trigger another tokens_ready, so none are
+        left behind.
+        """
+        self._wakeup_pending = False
+        tokens = []
+        try:
+            while True:
+                tokens.append(self._tokens.get_nowait())
+        except queue.Empty:
+            pass
+        return tokens
+
+    def configure_post_process(self, feed: Callable[[str], dict],
+                               close: Optional[Callable[[], dict]] = None):
+        """Parse the stream in the worker thread instead of the UI thread.
+
+        Each token is passed to *feed*; non-empty results are emitted through
+        parsed_signal. When the stream ends, *close* (if given) returns the
+        remaining results, emitted before finished_signal.
+
+        Args:
+            feed: Called with each token, returns newly completed results.
+            close: Called once after the last token, returns the rest.
+        """
+        self._post_feed = feed
+        self._post_close = close
 
     def stop(self):
         """Request the worker to stop."""
@@ -149,15 +189,29 @@ class GenerationWorker(QThread):
             return
 
         full_text = ""
+        tokens = self._tokens
         try:
             for token in self._generator(*self._generator_args, **self._generator_kwargs):
                 if self._stopped:
                     logger.info("Generation stopped by user")
                     return  # Don't emit finished_signal on stop
                 full_text += token
-                self.token_received.emit(token)
+                tokens.put(token)
+                # One wakeup per drain, not per token: while the UI thread
+                # is busy, tokens just pile up in the queue
+                if not self._wakeup_pending:
+                    self._wakeup_pending = True
+                    self.tokens_ready.emit()
+                if self._post_feed is not None:
+                    parsed = self._post_feed(token)
+                    if parsed:
+                        self.parsed_signal.emit(parsed)
 
             if not self._stopped:
+                if self._post_close is not None:
+                    parsed = self._post_close()
+                    if parsed:
+                        self.parsed_signal.emit(parsed)
                 self.finished_signal.emit(full_text)
 
         except ReddiScribeError as e:
@@ -185,6 +239,43 @@ class GenerationWorker(QThread):
         return "errors.ollama_not_running"
 
 
+class GenerationTaskSignals(QObject):
+    """Signals of a GenerationTask (QRunnable cannot emit signals itself)."""
+    finished_signal = pyqtSignal(str)    # complete text
+    error_occurred = pyqtSignal(str)     # i18n error key
+    done = pyqtSignal()                  # emitted last, after either of the above
+
+
+class GenerationTask(QRunnable):
+    """One-shot, non-streaming LLM call run on a QThreadPool.
+
+    For short on-demand requests (e.g. a single comment translation) where
+    starting a dedicated QThread per request is wasteful. The caller must
+    keep the task referenced until `signals.done` fires.
+    """
+
+    def __init__(self, generator_func: Callable, *args, **kwargs):
+        super().__init__()
+        self.signals = GenerationTaskSignals()
+        self._generator = generator_func
+        self._generator_args = args
+        self._generator_kwargs = kwargs
+
+    def run(self):
+        """Collect the generator output and emit it in one piece."""
+        try:
+            text = "".join(self._generator(*self._generator_args, **self._generator_kwargs))
+            self.signals.finished_signal.emit(text)
+        except ReddiScribeError as e:
+            self.signals.error_occurred.emit(GenerationWorker._map_error_to_i18n_key(e))
+            logger.error(f"Generation error: {e}")
+        except Exception as e:
+            self.signals.error_occurred.emit("errors.llm_timeout")
+            logger.error(f"Unexpected generation error: {e}")
+        finally:
+            self.signals.done.emit()
+
+
 class ModelFetchWorker(QThread):
     """Background worker for fetching available Ollama models.
 
@@ -126,7 +126,7 @@ class ReaderService:
         for token in self._llm.generate(
             prompt=prompt,
             model=self._config.get("llm.models.logic.name", ""),
-            num_ctx=8192,
+            num_ctx=self._config.get("llm.models.logic.num_ctx", 8192),
             stream=stream,
         ):
             full_text += token
@@ -151,6 +151,33 @@ class ReaderService:
         self._db.delete_summary(post_id, model_type="translation", locale=locale)
         logger.info(f"Deleted translation for post {post_id}")
 
+    def get_title_translation(self, post_id: str, locale: str = "ko_KR") -> Optional[str]:
+        """Check DB cache for an existing post title translation.
+
+        Args:
+            post_id: Reddit post ID
+            locale: Locale code
+
+        Returns:
+            Translated title if cached, None if not.
+        """
+        return self._db.get_summary(post_id, model_type="title", locale=locale)
+
+    def save_title_translation(self, post_id: str, text: str, locale: str = "ko_KR") -> None:
+        """Cache a translated post title so later fetches skip the LLM.
+
+        Args:
+            post_id: Reddit post ID
+            text: Translated title
+            locale: Locale code
+        """
+        self._db.save_summary(SummaryDTO(
+            post_id=post_id,
+            model_type="title",
+            text=text,
+            locale=locale,
+        ))
+
     def translate_titles(self, titles: list[str], locale: str = "ko_KR",
                          stream: bool = True) -> Iterator[str]:
         """Batch-translate post titles via LLM.
@@ -186,7 +213,7 @@ class ReaderService:
         yield from self._llm.generate(
             prompt=prompt,
             model=self._config.get("llm.models.logic.name", ""),
-            num_ctx=8192,
+            num_ctx=self._config.get("llm.models.logic.num_ctx", 8192),
             stream=stream,
         )
 
@@ -220,6 +247,6 @@ class ReaderService:
         yield from self._llm.generate(
             prompt=prompt,
             model=self._config.get("llm.models.logic.name", ""),
-            num_ctx=8192,
+            num_ctx=self._config.get("llm.models.logic.num_ctx", 8192),
             stream=stream,
         )
@@ -0,0 +1,66 @@
+"""In-memory cache of finished writer stage outputs."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_TTL_SECONDS = 3600.0
+
+
+class WriterCache:
+    """LRU cache with a time-to-live for writer pipeline results.
+
+    Keys are sha256 digests of the stage name plus everything the output
+    depends on (model, target language, input text), so re-translating the
+    same text with the same settings can skip the LLM call. Entries live for
+    the process only; nothing is written to disk.
+
+    Usage:
+        cache = WriterCache()
+        key = WriterCache.make_key("draft", model, target_lang, text)
+        cached = cache.get(key)
+        if cached is None:
+            cache.put(key, generated_text)
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl: float = DEFAULT_TTL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+        # key -> (stored_at, text), most recently used last
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def make_key(stage: str, *parts: str) -> str:
+        """Build a cache key from the stage name and its inputs."""
+        return hashlib.sha256("|".join((stage, *parts)).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached text for *key*, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, text = entry
+        if self._clock() - stored_at > self._ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return text
+
+    def put(self, key: str, text: str):
+        """Store *text* under *key*, evicting the least recently used entry."""
+        self._entries[key] = (self._clock(), text)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -2,11 +2,12 @@
 
 import logging
 import re
-from typing import Iterator
+from typing import Iterator, Optional
 
 from src.adapters.llm_adapter import LLMAdapter
 from src.core.config_manager import ConfigManager
 from src.core.types import WriterContext
+from src.services.writer_cache import WriterCache
 
 logger = logging.getLogger("reddiscribe")
 
@@ -38,11 +39,16 @@ class WriterService:
 
     All model names, temperatures, and prompts are read from ConfigManager
     so Settings UI changes take effect immediately.
+
+    Finished drafts are kept in a WriterCache so re-translating the same
+    text with the same draft prompt and logic model settings can skip Stage 1.
     """
 
-    def __init__(self, llm: LLMAdapter, config: ConfigManager):
+    def __init__(self, llm: LLMAdapter, config: ConfigManager,
+                 cache: Optional[WriterCache] = None):
         self._llm = llm
         self._config = config
+        self._cache = cache if cache is not None else WriterCache()
 
     def draft(self, source_text: str, target_lang: str = None, stream: bool = True) -> Iterator[str]:
         """Stage 1: Source language -> target language draft using logic model.
@@ -70,6 +76,33 @@ class WriterService:
             stream=stream,
         )
 
+    def prewarm_refine(self):
+        """Load the persona model used by refine() (blocking, best effort)."""
+        self._llm.preload(
+            model=self._config.get("llm.models.persona.name", ""),
+            num_ctx=self._config.get("llm.models.persona.num_ctx", 8192),
+        )
+
+    def cached_draft(self, source_text: str) -> Optional[str]:
+        """Return a previously finished draft of *source_text*, if still cached."""
+        return self._cache.get(self._draft_cache_key(source_text))
+
+    def remember_draft(self, source_text: str, draft: str):
+        """Cache a finished draft of *source_text* for later re-translations."""
+        if draft:
+            self._cache.put(self._draft_cache_key(source_text), draft)
+
+    def _draft_cache_key(self, source_text: str) -> str:
+        # Everything draft() sends to the LLM, so any setting change misses
+        target_lang = self._config.get("translation.target_lang", "English")
+        return WriterCache.make_key(
+            "draft",
+            self._config.get("llm.models.logic.name", ""),
+            str(self._config.get("llm.models.logic.num_ctx", 8192)),
+            str(self._config.get("llm.models.logic.temperature", 0.3)),
+            self._build_draft_prompt(source_text, target_lang),
+        )
+
     def polish(
         self, english_draft: str, korean_text: str = "",
         context: WriterContext = None, stream: bool = True
@@ -107,6 +107,36 @@ class TestConfigManagerGetSet:
         cm.set("new.nested.key", "value")
         assert cm.get("new.nested.key") == "value"
 
+    def test_get_many_returns_values_in_order(self):
+        cm = self._make_cm()
+        assert cm.get_many([
+            ("app.locale", None),
+            ("nonexistent.key", "fallback"),
+            ("app.theme", None),
+        ]) == ["ko_KR", "fallback", "dark"]
+
+    def test_set_notifies_listeners(self):
+        cm = self._make_cm()
+        seen = []
+        cm.add_listener(lambda key, value: seen.append((key, value)))
+        cm.set("app.locale", "en_US")
+        assert seen == [("app.locale", "en_US")]
+
+    def test_removed_listener_not_called(self):
+        cm = self._make_cm()
+        seen = []
+        listener = lambda key, value: seen.append(key)
+        cm.add_listener(listener)
+        cm.remove_listener(listener)
+        cm.set("app.locale", "en_US")
+        assert seen == []
+
+    def test_failing_listener_does_not_break_set(self):
+        cm = self._make_cm()
+        cm.add_listener(lambda key, value: 1 / 0)
+        cm.set("app.locale", "en_US")
+        assert cm.get("app.locale") == "en_US"
+
 
 class TestConfigManagerValidation:
     """Test validation rules in update()."""
@@ -155,6 +185,22 @@ class TestConfigManagerValidation:
         cm.update({"llm.providers.ollama.timeout": 10})
         assert cm.get("llm.providers.ollama.timeout") == 30
 
+    def test_update_returns_changed_keys_only(self, tmp_dir):
+        cm = self._make_cm(tmp_dir)
+        changed = cm.update({
+            "app.locale": "ko_KR",  # same as default
+            "app.log_level": "DEBUG",
+            "reddit.request_interval_sec": 1,  # clamped, still a change
+        })
+        assert changed == {"app.log_level", "reddit.request_interval_sec"}
+        assert cm.update({"app.log_level": "DEBUG"}) == set()
+
+    def test_update_without_changes_skips_save(self, tmp_dir):
+        cm = self._make_cm(tmp_dir)
+        with patch.object(cm, "save") as save:
+            cm.update({"app.locale": "ko_KR"})
+        save.assert_not_called()
+
 
 class TestConfigManagerGetMissingModels:
     """Test get_missing_models method."""
@@ -98,3 +98,51 @@ class TestI18nManagerGet:
         with patch("src.core.i18n_manager.LOCALE_DIR", locale_dir):
             mgr.load_locale("ko_KR")
         assert mgr.get("app") == "app"  # "app" is a dict, not a string
+
+
+class TestI18nManagerGetCached:
+    """Test memoized lookups."""
+
+    def test_get_cached_matches_get(self, locale_dir):
+        mgr = I18nManager()
+        with patch("src.core.i18n_manager.LOCALE_DIR", locale_dir):
+            mgr.load_locale("ko_KR")
+        assert mgr.get_cached("nav.read") == mgr.get("nav.read")
+        assert mgr.get_cached("nonexistent.key") == "nonexistent.key"
+
+    def test_get_cached_invalidated_on_locale_switch(self, locale_dir):
+        mgr = I18nManager()
+        with patch("src.core.i18n_manager.LOCALE_DIR", locale_dir):
+            mgr.load_locale("ko_KR")
+            assert mgr.get_cached("nav.write") == "작성"
+            mgr.load_locale("en_US")
+            assert mgr.get_cached("nav.write") == "Write"
+
+    def test_get_with_placeholder_uses_current_locale_template(self, locale_dir):
+        mgr = I18nManager()
+        with patch("src.core.i18n_manager.LOCALE_DIR", locale_dir):
+            mgr.load_locale("ko_KR")
+            mgr.get("errors.model_not_found", model="a")
+            mgr.load_locale("en_US")
+            assert mgr.get("errors.model_not_found", model="b") == "Model not found: b"
+
+    def test_snapshot_resolves_all_keys(self, locale_dir):
+        mgr = I18nManager()
+        with patch("src.core.i18n_manager.LOCALE_DIR", locale_dir):
+            mgr.load_locale("en_US")
+        snap = mgr.snapshot(("nav.read", "nav.write", "nonexistent.key"))
+        assert snap == {
+            "nav.read": mgr.get("nav.read"),
+            "nav.write": "Write",
+            "nonexistent.key": "nonexistent.key",
+        }
+
+    def test_revision_bumps_only_on_successful_load(self, locale_dir):
+        mgr = I18nManager()
+        with patch("src.core.i18n_manager.LOCALE_DIR", locale_dir):
+            mgr.load_locale("ko_KR")
+            rev = mgr.revision
+            mgr.load_locale("xx_XX")  # missing file
+            assert mgr.revision == rev
+            mgr.load_locale("en_US")
+            assert mgr.revision == rev + 1
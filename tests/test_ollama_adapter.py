@@ -518,6 +518,36 @@ class TestOllamaAdapterChat:
         assert result == ["Full response"]
 
 
+class TestOllamaAdapterPreload:
+    """Test model preloading."""
+
+    @patch("requests.post")
+    def test_sends_load_only_request(self, mock_post):
+        adapter = OllamaAdapter()
+        adapter.preload("llama3.1:8b", num_ctx=4096)
+
+        payload = mock_post.call_args.kwargs["json"]
+        assert mock_post.call_args.args[0] == "http://localhost:11434/api/generate"
+        assert payload["model"] == "llama3.1:8b"
+        assert "prompt" not in payload
+        assert payload["options"]["num_ctx"] == 4096
+        assert "llama3.1:8b" in adapter._used_models
+
+    @patch("requests.post")
+    def test_errors_are_swallowed(self, mock_post):
+        mock_post.side_effect = requests.ConnectionError("Connection refused")
+
+        adapter = OllamaAdapter()
+        adapter.preload("llama3.1:8b")  # must not raise
+
+    @patch("requests.post")
+    def test_empty_model_is_ignored(self, mock_post):
+        adapter = OllamaAdapter()
+        adapter.preload("")
+
+        mock_post.assert_not_called()
+
+
 class TestFormatModelSize:
     """Test format_model_size utility."""
 
@@ -540,6 +570,12 @@ class TestFormatModelSize:
     def test_zero_returns_empty(self):
         assert format_model_size(0) == ""
 
+    def test_repeated_size_is_memoized(self):
+        format_model_size.cache_clear()
+        first = format_model_size(7_000_000_000)
+        assert format_model_size(7_000_000_000) is first
+        assert format_model_size.cache_info().hits == 1
+
 
 class TestOllamaAdapterListModelsWithSize:
     """Test list_models_with_size method."""
@@ -113,6 +113,16 @@ class TestGetSubredditPosts:
         assert posts[0].title == "First Post"
         assert posts[1].score == 200
 
+    @patch("src.adapters.public_json_adapter.PublicJSONAdapter._fetch_json")
+    def test_posts_carry_display_suffix(self, mock_fetch):
+        mock_fetch.return_value = make_post_listing(
+            {"id": "p1", "title": "First Post", "score": 100, "num_comments": 7},
+        )
+        adapter = PublicJSONAdapter()
+        posts = adapter.get_subreddit_posts("python")
+
+        assert posts[0].display_suffix == "  [\u2191100]  [\U0001f4ac7]"
+
     @patch("src.adapters.public_json_adapter.PublicJSONAdapter._fetch_json")
     def test_passes_sort_and_limit(self, mock_fetch):
         mock_fetch.return_value = make_post_listing()
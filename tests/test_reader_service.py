@@ -69,3 +69,47 @@ class TestFetchComments:
 
         assert result == comments
         reddit.get_post_comments.assert_called_once_with("post1", "python", "top", 50)
+
+
+class TestTranslationNumCtx:
+    def test_translate_titles_uses_default_logic_ctx(self):
+        llm = make_mock_llm(["1. 제목"])
+        service = ReaderService(MagicMock(), llm, MagicMock(), make_mock_config())
+
+        list(service.translate_titles(["Hello world"]))
+
+        assert llm.generate.call_args.kwargs["num_ctx"] == 8192
+
+    def test_translate_comment_uses_configured_logic_ctx(self):
+        """Every logic-model call shares one num_ctx so Ollama never reloads the model."""
+        llm = make_mock_llm(["안녕"])
+        config = MagicMock()
+        config.get.side_effect = lambda key, default=None: (
+            4096 if key == "llm.models.logic.num_ctx" else default
+        )
+        service = ReaderService(MagicMock(), llm, MagicMock(), config)
+
+        list(service.translate_comment("Hello"))
+
+        assert llm.generate.call_args.kwargs["num_ctx"] == 4096
+
+
+class TestTitleTranslationCache:
+    def test_get_title_translation_reads_title_entry(self):
+        db = MagicMock()
+        db.get_summary.return_value = "제목"
+        service = ReaderService(MagicMock(), MagicMock(), db, make_mock_config())
+
+        assert service.get_title_translation("p1", locale="ko_KR") == "제목"
+        db.get_summary.assert_called_once_with("p1", model_type="title", locale="ko_KR")
+
+    def test_save_title_translation_writes_title_entry(self):
+        db = MagicMock()
+        service = ReaderService(MagicMock(), MagicMock(), db, make_mock_config())
+
+        service.save_title_translation("p1", "제목", locale="ko_KR")
+
+        saved = db.save_summary.call_args[0][0]
+        assert (saved.post_id, saved.model_type, saved.text, saved.locale) == (
+            "p1", "title", "제목", "ko_KR",
+        )
@@ -0,0 +1,78 @@
+"""Tests for WriterCache."""
+
+from src.services.writer_cache import WriterCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMakeKey:
+    """Test cache key construction."""
+
+    def test_same_inputs_same_key(self):
+        assert WriterCache.make_key("draft", "m", "hi") == WriterCache.make_key("draft", "m", "hi")
+
+    def test_stage_changes_key(self):
+        assert WriterCache.make_key("draft", "m", "hi") != WriterCache.make_key("polish", "m", "hi")
+
+    def test_parts_change_key(self):
+        assert WriterCache.make_key("draft", "m1", "hi") != WriterCache.make_key("draft", "m2", "hi")
+
+
+class TestGetPut:
+    """Test storing and retrieving entries."""
+
+    def test_missing_key_returns_none(self):
+        cache = WriterCache()
+        assert cache.get("nope") is None
+
+    def test_put_then_get(self):
+        cache = WriterCache()
+        cache.put("k", "Hello")
+        assert cache.get("k") == "Hello"
+
+    def test_put_overwrites(self):
+        cache = WriterCache()
+        cache.put("k", "old")
+        cache.put("k", "new")
+        assert cache.get("k") == "new"
+        assert len(cache) == 1
+
+    def test_clear(self):
+        cache = WriterCache()
+        cache.put("k", "v")
+        cache.clear()
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+
+class TestEviction:
+    """Test LRU and TTL eviction."""
+
+    def test_evicts_least_recently_used(self):
+        cache = WriterCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")  # "b" is now the oldest
+        cache.put("c", "3")
+
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+
+    def test_expired_entry_is_dropped(self):
+        clock = FakeClock()
+        cache = WriterCache(ttl=10.0, clock=clock)
+        cache.put("k", "v")
+
+        clock.now = 5.0
+        assert cache.get("k") == "v"
+
+        clock.now = 11.0
+        assert cache.get("k") is None
+        assert len(cache) == 0
@@ -225,6 +225,53 @@ class TestConfigIntegration:
         assert "test input" in prompt
 
 
+class TestPrewarmRefine:
+    """Test loading the refine model ahead of time."""
+
+    def test_preloads_persona_model(self):
+        llm = MagicMock()
+        service = _make_service(llm)
+        service.prewarm_refine()
+
+        llm.preload.assert_called_once_with(model="llama3.1:70b", num_ctx=8192)
+
+
+class TestDraftCache:
+    """Test caching of finished drafts."""
+
+    def test_miss_before_remember(self):
+        service = _make_service()
+        assert service.cached_draft("안녕하세요") is None
+
+    def test_hit_after_remember(self):
+        service = _make_service()
+        service.remember_draft("안녕하세요", "Hello")
+        assert service.cached_draft("안녕하세요") == "Hello"
+
+    def test_model_change_misses(self):
+        service = _make_service()
+        service.remember_draft("안녕하세요", "Hello")
+        service._config.set("llm.models.logic.name", "qwen2.5:7b")
+        assert service.cached_draft("안녕하세요") is None
+
+    def test_target_lang_change_misses(self):
+        service = _make_service()
+        service.remember_draft("안녕하세요", "Hello")
+        service._config.set("translation.target_lang", "Japanese")
+        assert service.cached_draft("안녕하세요") is None
+
+    def test_temperature_change_misses(self):
+        service = _make_service()
+        service.remember_draft("안녕하세요", "Hello")
+        service._config.set("llm.models.logic.temperature", 0.9)
+        assert service.cached_draft("안녕하세요") is None
+
+    def test_empty_draft_not_cached(self):
+        service = _make_service()
+        service.remember_draft("안녕하세요", "")
+        assert service.cached_draft("안녕하세요") is None
+
+
 class TestBuildRefineContext:
     """Test refine chat context building."""
 